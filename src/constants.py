@@ -15,30 +15,42 @@ RENDER_KW_REQ = RENDER_KW | {"required": True}
 CACHE_KEY_ACTIVE_RELEASES = "active_releases"
 CACHE_KEY_ACTIVE_RELEASES_PAGE = "active_releases_page_{offset}_{limit}"
 CACHE_TTL_ACTIVE_RELEASES = 3600 * 24 * 14  # 14 days
+CACHE_TTL_ACTIVE_RELEASES_PAGE = 30  # short TTL: workers that missed invalidation self-heal
+CACHE_KEY_API_TOKEN = "api_token__{hashed_token}"
+CACHE_TTL_API_TOKEN = 30  # verified API token state
+CACHE_TTL_API_TOKEN_UNKNOWN = 3  # unknown token: short, blunts probing only
+CACHE_KEY_DASHBOARD_COUNTS = "admin_dashboard_counts"
+CACHE_TTL_DASHBOARD_COUNTS = 60
+# errors of these routes are served with the unified JSON response (admin keeps its own pages)
+API_PATH_PREFIXES = ("/api/", "/public/")
 
 # Headers to exclude when proxying requests
-PROXY_EXCLUDED_REQUEST_HEADERS = {
-    "host",
-    "content-length",
-    "connection",
-    "transfer-encoding",
-    "upgrade",
-    "proxy-connection",
-    "proxy-authenticate",
-    "proxy-authorization",
-    "te",
-    "trailer",
-}
+PROXY_EXCLUDED_REQUEST_HEADERS = frozenset(
+    {
+        "host",
+        "content-length",
+        "connection",
+        "transfer-encoding",
+        "upgrade",
+        "proxy-connection",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+    }
+)
 
-PROXY_EXCLUDED_RESPONSE_HEADERS = {
-    "content-encoding",
-    "content-length",
-    "transfer-encoding",
-    "connection",
-    "upgrade",
-    "keep-alive",
-    "proxy-authenticate",
-    "proxy-authorization",
-    "te",
-    "trailer",
-}
+PROXY_EXCLUDED_RESPONSE_HEADERS = frozenset(
+    {
+        "content-encoding",
+        "content-length",
+        "transfer-encoding",
+        "connection",
+        "upgrade",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+    }
+)
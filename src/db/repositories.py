@@ -8,11 +8,11 @@ from typing import (
     Any,
     Sequence,
     ParamSpec,
-    cast,
 )
 
-from sqlalchemy import select, BinaryExpression, delete, Select, update, CursorResult, func
+from sqlalchemy import select, exists, BinaryExpression, delete, Select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.elements import SQLCoreOperations
 from sqlalchemy.sql.roles import ColumnsClauseRole
 
@@ -104,15 +104,20 @@ class BaseRepository(Generic[ModelT]):
         statement = delete(self.model).filter(self.model.id.in_(removing_ids))
         await self.session.execute(statement)
 
-    async def update_by_ids(self, updating_ids: Sequence[int], value: dict[str, Any]) -> None:
-        """Update the instances by their IDs"""
+    async def update_by_ids(self, updating_ids: Sequence[int], value: dict[str, Any]) -> list[int]:
+        """Update the instances by their IDs and return IDs of the actually updated rows"""
         logger.info("[DB] Updating %i instances: %r", len(updating_ids), updating_ids)
-        statement = update(self.model).filter(self.model.id.in_(updating_ids))
-        result: CursorResult[Any] = cast(
-            CursorResult[Any], await self.session.execute(statement, value)
+        statement = (
+            update(self.model)
+            .filter(self.model.id.in_(updating_ids))
+            .values(value)
+            .returning(self.model.id)
         )
+        result = await self.session.execute(statement)
+        updated_ids: list[int] = list(result.scalars().all())
         await self.session.flush()
-        logger.info("[DB] Updated %i instances", result.rowcount)
+        logger.info("[DB] Updated %i instances", len(updated_ids))
+        return updated_ids
 
     def _prepare_statement(
         self,
@@ -146,6 +151,13 @@ class UserRepository(BaseRepository[User]):
 
         return users[0]
 
+    async def username_exists(self, username: str) -> bool:
+        """Check if a user with the given username exists (without loading the row)"""
+
+        logger.debug("[DB] Checking username existence: %s", username)
+        statement = select(exists().where(self.model.username == username))
+        return bool(await self.session.scalar(statement))
+
 
 class TokenRepository(BaseRepository[Token]):
     """Token's repository."""
@@ -155,21 +167,25 @@ class TokenRepository(BaseRepository[Token]):
     async def get_by_token(self, hashed_token: str) -> Token | None:
         """Get token by hashed token value"""
         logger.debug("[DB] Getting token by hash: %s", hashed_token)
-        filtered_tokens = await self.all(token=hashed_token)
-        if not filtered_tokens:
-            return None
-
-        return filtered_tokens[0]
+        # token with its user in a single query (lookup by the unique index on token)
+        statement = (
+            select(self.model)
+            .options(joinedload(self.model.user))
+            .filter(self.model.token == hashed_token)
+            .limit(1)
+        )
+        result = await self.session.execute(statement)
+        return result.scalars().first()
 
-    async def set_active(self, token_ids: Sequence[int], is_active: bool) -> None:
-        """Set active status for tokens by their IDs"""
+    async def set_active(self, token_ids: Sequence[int], is_active: bool) -> list[int]:
+        """Set active status for tokens by their IDs (returns IDs of updated tokens)"""
         logger.info(
             "[DB] %s %i tokens: %r",
             "Deactivating" if not is_active else "Activating",
             len(token_ids),
             token_ids,
         )
-        await self.update_by_ids(token_ids, {"is_active": is_active})
+        return await self.update_by_ids(token_ids, {"is_active": is_active})
 
 
 class ReleaseRepository(BaseRepository[Release]):
@@ -178,24 +194,16 @@ class ReleaseRepository(BaseRepository[Release]):
     model = Release
 
     async def group_by_active(self, **filters: FilterT) -> ActiveReleasesStat:
-        """Selects instances from DB"""
+        """Counts active / inactive releases (single row with conditional aggregation)"""
         statement = self._prepare_statement(
             filters=filters,
             entities=[
-                self.model.is_active,
-                func.count("*"),
+                func.count().filter(self.model.is_active.is_(True)),
+                func.count().filter(self.model.is_active.is_(False)),
             ],
-        ).group_by(self.model.is_active)
-
-        active_stat: ActiveReleasesStat = ActiveReleasesStat()
-        for r in await self.session.execute(statement):
-            is_active, count = r
-            if is_active:
-                active_stat.active = count
-            else:
-                active_stat.inactive = count
-
-        return active_stat
+        )
+        active, inactive = (await self.session.execute(statement)).one()
+        return ActiveReleasesStat(active=active or 0, inactive=inactive or 0)
 
     async def get_active_releases(
         self, offset: int = 0, limit: int = 10
@@ -215,18 +223,25 @@ class ReleaseRepository(BaseRepository[Release]):
             self.model.is_active.is_(True),
             self.model.published_at <= utcnow(),
         )
-        releases = await self.session.scalars(
-            select(self.model)
+        # page with total count in a single query (window function)
+        result = await self.session.execute(
+            select(self.model, func.count().over().label("total"))
             .filter(*releases_criteria)
             .order_by(self.model.published_at.desc())
             .offset(offset)
             .limit(limit)
         )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
 
-        # total calculating
+        if not offset:
+            return [], 0
+
+        # page is out of range: no rows to take the total count from
         count_query = select(func.count(self.model.id)).filter(*releases_criteria)
         total = await self.session.scalar(count_query) or 0
-        return list(releases.all()), total
+        return [], total
 
     async def get_all_paginated(
         self, offset: int = 0, limit: int = 10, **filters: FilterT
@@ -263,9 +278,27 @@ class ReleaseRepository(BaseRepository[Release]):
 
         return list(releases.all()), total
 
-    async def set_active(self, release_ids: Sequence[int], is_active: bool) -> None:
-        """Set active status for releases by their IDs"""
+    async def set_active(self, release_ids: Sequence[int], is_active: bool) -> list[int]:
+        """Set active status for releases by their IDs (returns IDs of updated releases)"""
         logger.info(
             "[DB] %s releases: %r", "Deactivating" if not is_active else "Activating", release_ids
         )
-        await self.update_by_ids(release_ids, {"is_active": is_active})
+        return await self.update_by_ids(release_ids, {"is_active": is_active})
+
+    async def set_active_returning(
+        self, release_ids: Sequence[int], is_active: bool
+    ) -> list[Release]:
+        """Set active status for releases by their IDs (returns updated releases)"""
+        logger.info(
+            "[DB] %s releases: %r", "Deactivating" if not is_active else "Activating", release_ids
+        )
+        # single UPDATE ... RETURNING: no need to select releases before updating
+        statement = (
+            update(self.model)
+            .filter(self.model.id.in_(release_ids))
+            .values(is_active=is_active)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
@@ -18,6 +18,8 @@ class SASessionUOW:
     2. Dependency mode: accepts a session from FastAPI dependency injection
 
     In both modes, it provides explicit transaction control for atomic operations.
+    Standalone mode can be read-only: no explicit transaction, flush or commit -
+    the session is just closed on exit (returns its connection to the pool right away).
 
     Examples:
         # Standalone mode
@@ -29,6 +31,10 @@ class SASessionUOW:
             token = await token_repo.create(token_data)
             uow.mark_for_commit()
 
+        # Read-only standalone mode
+        async with SASessionUOW(read_only=True) as uow:
+            token = await TokenRepository(session=uow.session).get_by_token(hashed_token)
+
         # Dependency mode
         async def endpoint(uow: SASessionUOW = Depends(get_uow_with_session)):
             async with uow:
@@ -37,16 +43,21 @@ class SASessionUOW:
                 uow.mark_for_commit()
     """
 
-    def __init__(self, session: AsyncSession | None = None) -> None:
+    def __init__(self, session: AsyncSession | None = None, read_only: bool = False) -> None:
         """
         Initialize UOW with optional session.
 
         Args:
             session: If provided, uses this session (dependency injection mode)
                     If None, creates new session from factory (standalone mode)
+            read_only: Skip transaction handling for pure SELECTs (standalone mode only)
         """
+        if read_only and session is not None:
+            raise ValueError("Read-only mode is supported for standalone UOW only")
+
         self.__need_to_commit: bool = False
         self.__owns_session: bool = False
+        self.__read_only: bool = read_only
         if session is None:
             # Standalone mode: create new session
             session_factory = db_session.get_session_factory()
@@ -59,6 +70,8 @@ class SASessionUOW:
     async def __aenter__(self) -> Self:
         """Enter transaction context and start transaction if needed."""
         logger.debug("[DB] Entering UOW transaction block")
+        if self.__read_only:
+            return self
 
         # Start transaction if we own the session or if no transaction is active
         if self.__owns_session or not self.__session.in_transaction():
@@ -78,6 +91,11 @@ class SASessionUOW:
             logger.debug("[DB] Session already closed")
             return
 
+        if self.__read_only:
+            await self.__session.close()
+            logger.debug("[DB] Read-only session closed")
+            return
+
         try:
             # Flush any pending changes
             await self.__session.flush()
@@ -35,7 +35,13 @@ class AsyncDBConnectors:
         logger.info("[DB] Initializing database engine and session factory...")
 
         try:
-            extra_kwargs: dict[str, str | int] = {"echo": self.settings.echo}
+            extra_kwargs: dict[str, str | int] = {
+                "echo": self.settings.echo,
+                # LIFO keeps hot connections reused (idle ones expire), pre-ping drops stale ones
+                "pool_pre_ping": self.settings.pool_pre_ping,
+                "pool_recycle": self.settings.pool_recycle,
+                "pool_use_lifo": self.settings.pool_use_lifo,
+            }
             if self.settings.pool_min_size:
                 extra_kwargs["pool_size"] = self.settings.pool_min_size
 
@@ -6,18 +6,24 @@ from typing import Any, Callable, AsyncGenerator
 
 import uvicorn
 from fastapi import FastAPI, Depends
+from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
+from pydantic import ValidationError
+from starlette.exceptions import HTTPException
 
 from src.db.redis import close_redis, initialize_redis
 from src.db.clickhouse import close_clickhouse, initialize_clickhouse
 from src.modules.auth.dependencies import verify_api_token
 from src.modules.admin.app import make_admin
-from src.exceptions import AppSettingsError, StartupError
+from src.exceptions import AppSettingsError, StartupError, BaseApplicationError
 from src.settings import get_app_settings, AppSettings
 from src.modules.api import system_router
 from src.modules.api.public import public_router as releases_public_router
 from src.modules.api.releases import admin_router as releases_router
 from src.db.session import initialize_database, close_database
+from src.services.analytics import start_analytics_writer, stop_analytics_writer
+from src.services.proxy import close_proxy_client
+from src.utils import api_exception_handler, ErrorHandlingMiddleware, FastJSONResponse
 
 logger = logging.getLogger("src.main")
 
@@ -66,6 +72,7 @@ async def lifespan(app: ReleaseAgentAPP) -> AsyncGenerator[None, None]:
         logger.warning("Analytics will be disabled")
     else:
         logger.info("ClickHouse connection startup completed")
+        start_analytics_writer()
 
     logger.info("Setting up admin application...")
     make_admin(app)
@@ -89,6 +96,16 @@ async def lifespan(app: ReleaseAgentAPP) -> AsyncGenerator[None, None]:
         else:
             logger.info("Redis connection shutdown completed successfully")
 
+    try:
+        await stop_analytics_writer()
+    except Exception as exc:
+        logger.error("Error during analytics writer shutdown: %r", exc)
+
+    try:
+        await close_proxy_client()
+    except Exception as exc:
+        logger.error("Error during proxy client shutdown: %r", exc)
+
     try:
         await close_clickhouse()
     except Exception as exc:
@@ -119,9 +136,17 @@ def make_app(settings: AppSettings | None = None) -> ReleaseAgentAPP:
         docs_url="/api/docs/" if settings.flags.api_docs_enabled else None,
         redoc_url="/api/redoc/" if settings.flags.api_docs_enabled else None,
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
     app.set_settings(settings)
 
+    # Unified JSON error responses for API routes: known errors are handled by ExceptionMiddleware,
+    # unexpected ones - by ErrorHandlingMiddleware (admin's errors are served as before)
+    for exc_class in (BaseApplicationError, RequestValidationError, ValidationError, HTTPException):
+        app.add_exception_handler(exc_class, api_exception_handler)
+
+    app.add_middleware(ErrorHandlingMiddleware)
+
     logger.info("Setting up routes...")
     # Public routes (no authentication required)
     app.include_router(releases_public_router, prefix="/public")
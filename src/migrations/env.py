@@ -25,7 +25,8 @@ if config.config_file_name is not None:
 db_settings = get_db_settings()
 
 target_metadata = BaseModel.metadata
-config.set_main_option("sqlalchemy.url", db_settings.dsn)
+# escape "%" (URL-encoded credentials) from configparser's interpolation
+config.set_main_option("sqlalchemy.url", db_settings.dsn.replace("%", "%%"))
 
 
 def run_migrations_offline() -> None:
@@ -28,6 +28,7 @@ class BaseModelView(ModelView):
     can_export = False
     is_async = True
     custom_post_create: ClassVar[bool] = False
+    _list_url_path: str | None = None
 
     async def handle_post_create(self, request: Request, object_id: int) -> Response:
         if not self.custom_post_create:
@@ -41,3 +42,10 @@ class BaseModelView(ModelView):
         context = {"model_view": self, "model": model, "title": self.name}
 
         return await self.templates.TemplateResponse(request, self.details_template, context)
+
+    def _get_list_url_path(self, request: Request) -> str:
+        """Path of the view's list page (resolved once per view instance, i.e. per admin app)"""
+        if self._list_url_path is None:
+            self._list_url_path = request.url_for("admin:list", identity=self.identity).path
+
+        return self._list_url_path
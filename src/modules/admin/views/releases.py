@@ -2,6 +2,7 @@ import logging
 import datetime
 from typing import cast, Any, Callable
 import functools
+from contextvars import ContextVar
 
 from sqladmin import action
 from sqlalchemy import Select, select, func
@@ -20,6 +21,8 @@ from src.modules.admin.utils import format_datetime, format_date
 __all__ = ("ReleaseAdminView",)
 logger = logging.getLogger(__name__)
 type ReleaseSelectT = Select[tuple[Release]]
+# list query of the current request (the view instance is shared between requests)
+_CACHED_QUERY: ContextVar[ReleaseSelectT | None] = ContextVar("cached_query", default=None)
 
 
 def _make_datetime_formatter(column_name: str) -> Any:
@@ -56,6 +59,14 @@ def _make_date_formatter(column_name: str) -> Any:
     return formatter
 
 
+_TRUTHY = frozenset({"true", "1", "yes"})
+_ACTIVE_FILTER = Release.is_active.is_(True)
+_INACTIVE_FILTER = Release.is_active.is_(False)
+_PUBLISHED_AT_FMT = _make_date_formatter("published_at")
+_CREATED_AT_FMT = _make_datetime_formatter("created_at")
+_UPDATED_AT_FMT = _make_datetime_formatter("updated_at")
+
+
 def _invalidate_releases(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to invalidate releases cache after the function is called"""
 
@@ -94,14 +105,14 @@ class ReleaseAdminView(BaseModelView, model=Release):
     }
     column_formatters = {
         Release.id: lambda model, a: admin_get_link(cast(BaseModel, model), target="details"),
-        Release.published_at: _make_date_formatter("published_at"),
-        Release.created_at: _make_datetime_formatter("created_at"),
-        Release.updated_at: _make_datetime_formatter("updated_at"),
+        Release.published_at: _PUBLISHED_AT_FMT,
+        Release.created_at: _CREATED_AT_FMT,
+        Release.updated_at: _UPDATED_AT_FMT,
     }
     column_formatters_detail = {
-        Release.published_at: _make_date_formatter("published_at"),
-        Release.created_at: _make_datetime_formatter("created_at"),
-        Release.updated_at: _make_datetime_formatter("updated_at"),
+        Release.published_at: _PUBLISHED_AT_FMT,
+        Release.created_at: _CREATED_AT_FMT,
+        Release.updated_at: _UPDATED_AT_FMT,
     }
     column_details_list = (
         Release.id,
@@ -114,29 +125,26 @@ class ReleaseAdminView(BaseModelView, model=Release):
     )
     column_default_li = ()
     form_overrides = dict(notes=HiddenField)
-    _cached_query: ReleaseSelectT
     update_model = _invalidate_releases(BaseModelView.update_model)
     insert_model = _invalidate_releases(BaseModelView.insert_model)
     delete_model = _invalidate_releases(BaseModelView.delete_model)
 
     def list_query(self, request: Request) -> ReleaseSelectT:
         """Search licenses by requested filters"""
-        request_active = request.query_params.get("active", "").lower() == "true"
-        request_inactive = request.query_params.get("inactive", "").lower() == "true"
+        query_params = request.query_params
         query: ReleaseSelectT = super().list_query(request).order_by(Release.published_at.desc())
-        if request_active:
-            query = query.filter(Release.is_active.is_(True))
-        elif request_inactive:
-            query = query.filter(Release.is_active.is_(False))
+        if query_params.get("active", "").lower() in _TRUTHY:
+            query = query.filter(_ACTIVE_FILTER)
+        elif query_params.get("inactive", "").lower() in _TRUTHY:
+            query = query.filter(_INACTIVE_FILTER)
 
-        self._cached_query = query
+        _CACHED_QUERY.set(query)
         return query
 
     def count_query(self, request: Request) -> Select[tuple[int]]:
         """Calculates total number of releases (used for correct pagination)"""
-        if hasattr(self, "_cached_query"):
-            query = self._cached_query
-        else:
+        query = _CACHED_QUERY.get()
+        if query is None:
             query = self.list_query(request)
 
         return select(func.count()).select_from(query.subquery())
@@ -148,7 +156,6 @@ class ReleaseAdminView(BaseModelView, model=Release):
         add_in_list=True,
         confirmation_message="Are you sure you want to deactivate selected releases?",
     )
-    @_invalidate_releases
     async def deactivate_releases(self, request: Request) -> Response:
         """Deactivate releases by their IDs"""
         return await self._set_active(request, is_active=False)
@@ -160,7 +167,6 @@ class ReleaseAdminView(BaseModelView, model=Release):
         add_in_list=True,
         confirmation_message="Are you sure you want to activate selected releases?",
     )
-    @_invalidate_releases
     async def activate_releases(self, request: Request) -> Response:
         """Activate releases by their IDs"""
         return await self._set_active(request, is_active=True)
@@ -178,7 +184,11 @@ class ReleaseAdminView(BaseModelView, model=Release):
         )
         async with SASessionUOW() as uow:
             repo = ReleaseRepository(session=uow.session)
-            await repo.set_active(release_ids, is_active=is_active)
+            updated_ids = await repo.set_active(release_ids, is_active=is_active)
             await uow.commit()
 
-        return RedirectResponse(url=request.url_for("admin:list", identity=self.identity))
+        if updated_ids:
+            await invalidate_release_cache()
+            logger.debug("[ADMIN] Invalidated releases cache (updated: %r)", updated_ids)
+
+        return RedirectResponse(url=self._get_list_url_path(request))
@@ -1,6 +1,6 @@
 import logging
 import datetime
-from typing import cast
+from typing import Any, cast
 
 from sqladmin import action
 from starlette.datastructures import URL
@@ -11,6 +11,7 @@ from src.db.repositories import TokenRepository
 from src.db.services import SASessionUOW
 from src.db.models import BaseModel, Token
 from src.services import cache as cache_service
+from src.services.cache import invalidate_api_token_cache
 from src.utils import admin_get_link
 from src.modules.auth.tokens import make_api_token
 from src.modules.admin.views.base import BaseModelView, FormDataType
@@ -52,6 +53,8 @@ class TokenAdminView(BaseModelView, model=Token):
         token_info = make_api_token(expires_at=expires_at, settings=self.app.settings)
         data["token"] = token_info.hashed_value
         token: Token = await super().insert_model(request, data)
+        # the token could be probed (and its "unknown" state cached) right before creation
+        await invalidate_api_token_cache(hashed_token=token_info.hashed_value)
         cache = cache_service.get_cache(backend="memory")
         # 10 seconds for showing to user
         await cache.set(f"token__{token.id}", token_info.value, ttl=10)
@@ -69,6 +72,17 @@ class TokenAdminView(BaseModelView, model=Token):
         await cache.invalidate(cache_key)
         return token
 
+    async def update_model(self, request: Request, pk: str, data: FormDataType) -> Any:
+        """Update token and drop cached states of verified tokens"""
+        token = await super().update_model(request, pk, data)
+        await invalidate_api_token_cache()
+        return token
+
+    async def delete_model(self, request: Request, pk: Any) -> None:
+        """Delete token and drop cached states of verified tokens"""
+        await super().delete_model(request, pk)
+        await invalidate_api_token_cache()
+
     def get_save_redirect_url(self, request: Request, token: Token) -> URL:
         """Override get_redirect_url method to return specific URL"""
         return self._build_url_for("admin:details", request=request, obj=token)
@@ -112,4 +126,5 @@ class TokenAdminView(BaseModelView, model=Token):
             await TokenRepository(session=uow.session).set_active(token_ids, is_active=is_active)
             await uow.commit()
 
-        return RedirectResponse(url=request.url_for("admin:list", identity=self.identity))
+        await invalidate_api_token_cache()
+        return RedirectResponse(url=self._get_list_url_path(request))
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import cast, Any, Mapping, Sequence
 
@@ -9,6 +10,7 @@ from src.db import SASessionUOW, UserRepository
 from src.modules.admin.views.base import BaseModelView, FormDataType
 from src.constants import RENDER_KW_REQ
 from src.db.models import BaseModel, User
+from src.services.cache import invalidate_api_token_cache
 from src.utils import admin_get_link
 
 __all__ = ("UserAdminView",)
@@ -52,12 +54,12 @@ class UserAdminView(BaseModelView, model=User):
         """Create a new user and insert it into the database"""
 
         raw_password = data.pop("new_password", None)
-        if raw_password:
-            data["password"] = User.make_password(str(raw_password))
-        else:
+        if not raw_password:
             raise HTTPException(status_code=400, detail="Password required")
 
         await self._validate_username(username=cast(str, data.get("username")))
+        # password hashing is CPU-bound: keep the event loop free while it runs
+        data["password"] = await asyncio.to_thread(User.make_password, str(raw_password))
 
         return await super().insert_model(request, data)
 
@@ -68,14 +70,21 @@ class UserAdminView(BaseModelView, model=User):
         raw_password = data.pop("new_password", None)
         data.pop("repeat_password", None)
         if raw_password:
-            data["password"] = User.make_password(str(raw_password))
+            data["password"] = await asyncio.to_thread(User.make_password, str(raw_password))
+
+        user = await super().update_model(request, pk, data)
+        # user's activity is a part of cached API token's state
+        await invalidate_api_token_cache()
+        return user
 
-        return await super().update_model(request, pk, data)
+    async def delete_model(self, request: Request, pk: Any) -> None:
+        """Delete user (with its tokens) and drop cached states of verified tokens"""
+        await super().delete_model(request, pk)
+        await invalidate_api_token_cache()
 
     @staticmethod
     async def _validate_username(username: str) -> None:
         async with SASessionUOW() as uow:
             user_repo = UserRepository(session=uow.session)
-            exists_user = await user_repo.get_by_username(username)
-            if exists_user is not None:
+            if await user_repo.username_exists(username):
                 raise HTTPException(status_code=400, detail="Username already taken")
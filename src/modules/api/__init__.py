@@ -1,8 +1,3 @@
-from .base import ErrorHandlingBaseRoute, CORSBaseRoute
 from .system import router as system_router
 
-__all__ = (
-    "system_router",
-    "ErrorHandlingBaseRoute",
-    "CORSBaseRoute",
-)
+__all__ = ("system_router",)
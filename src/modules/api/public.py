@@ -4,26 +4,29 @@ from enum import StrEnum
 from typing import Any
 
 from fastapi import APIRouter, Query, Request
-from pydantic import ValidationError
-from starlette.background import BackgroundTasks
+from pydantic import TypeAdapter, ValidationError
 from starlette.responses import PlainTextResponse
 
-from src.constants import CACHE_KEY_ACTIVE_RELEASES_PAGE
+from src.constants import CACHE_KEY_ACTIVE_RELEASES_PAGE, CACHE_TTL_ACTIVE_RELEASES_PAGE
 from src.db.clickhouse import ReleasesAnalyticsSchema
 from src.exceptions import InstanceLookupError
 from src.models import LatestVersionResponse, ReleasePublicResponse, PaginatedResponse
-from src.modules.api import ErrorHandlingBaseRoute
 from src.db.repositories import ReleaseRepository
 from src.db.services import SASessionUOW
-from src.services.cache import CacheProtocol, get_cache
-from src.services.analytics import AnalyticsService
+from src.services.cache import CacheProtocol, SingleFlight, get_cache
+from src.services.analytics import get_analytics_writer
 from src.settings import get_app_settings
-from src.settings.db import get_clickhouse_settings
 from src.utils import utcnow
 
 logger = logging.getLogger(__name__)
 __all__ = ("public_router",)
 
+_ReleasesPage = PaginatedResponse[ReleasePublicResponse]
+_RELEASES_ADAPTER: TypeAdapter[list[ReleasePublicResponse]] = TypeAdapter(
+    list[ReleasePublicResponse]
+)
+_release_pages_flight: SingleFlight[_ReleasesPage] = SingleFlight()
+
 
 class _LatestVersionFormat(StrEnum):
     JSON = "json"
@@ -44,7 +47,6 @@ public_router = APIRouter(
     prefix="/releases",
     tags=["public"],
     responses={404: {"description": "Not found"}},
-    route_class=ErrorHandlingBaseRoute,
 )
 
 
@@ -61,7 +63,7 @@ async def get_latest_release_version(
     limit = 1
     cache_key = CACHE_KEY_ACTIVE_RELEASES_PAGE.format(offset=offset, limit=limit)
     cache: CacheProtocol = get_cache()
-    response_result: PaginatedResponse[ReleasePublicResponse] | None = None
+    response_result: _ReleasesPage | None = None
 
     settings = get_app_settings()
     if settings.flags.api_cache_enabled:
@@ -69,16 +71,7 @@ async def get_latest_release_version(
 
     if response_result is None:
         logger.debug("[API] Public: Latest release not found in cache, getting from database")
-        async with SASessionUOW() as uow:
-            repo = ReleaseRepository(session=uow.session)
-            releases, total = await repo.get_active_releases(offset=offset, limit=limit)
-            response_result = PaginatedResponse[ReleasePublicResponse](
-                items=[ReleasePublicResponse.model_validate(release) for release in releases],
-                total=total,
-                offset=offset,
-                limit=limit,
-            )
-            await cache.set(cache_key, response_result.model_dump(mode="json"))
+        response_result = await _load_release_page(cache, cache_key, offset=offset, limit=limit)
 
     version = _get_latest_version(response_result)
     if version is None:
@@ -93,7 +86,6 @@ async def get_latest_release_version(
 @public_router.get("/", response_model=PaginatedResponse[ReleasePublicResponse])
 async def get_active_releases(
     request: Request,
-    background_tasks: BackgroundTasks,
     offset: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of items to return"),
     current_version: str | None = Query(None, description="Current client version"),
@@ -102,26 +94,18 @@ async def get_active_releases(
     is_internal: bool | None = Query(None, description="Indicates if the client is internal"),
 ) -> PaginatedResponse[ReleasePublicResponse]:
     """Get paginated list of active releases (public endpoint, no authentication required)"""
-    start_time = time.time()
+    start_time = time.monotonic()
     logger.debug("[API] Public: Getting active releases (offset=%i, limit=%i)", offset, limit)
 
     settings = get_app_settings()
-    cached_result: dict[str, Any] | None = None
+    cached_result: _ReleasesPage | None = None
     cache: CacheProtocol = get_cache()
     cache_key = CACHE_KEY_ACTIVE_RELEASES_PAGE.format(offset=offset, limit=limit)
     if settings.flags.api_cache_enabled:
-        cached_data = await cache.get(cache_key)
-        cached_result = cached_data if cached_data and isinstance(cached_data, dict) else None
+        cached_result = _get_cached_release_page(await cache.get(cache_key))
 
-    if cached_result:
-        response_result = PaginatedResponse[ReleasePublicResponse].model_validate(cached_result)
-        logger.info(
-            "[API] Public: Releases found in cache (offset=%i, limit=%i): %i releases | latest: %s",
-            offset,
-            limit,
-            len(response_result.items),
-            _get_latest_version(response_result) or "N/A",
-        )
+    if cached_result is not None:
+        response_result = cached_result
         response_status = 200
     else:
         logger.debug(
@@ -129,32 +113,25 @@ async def get_active_releases(
             offset,
             limit,
         )
-        # TODO: cover with tests and refactor (use service layer instead)
-        async with SASessionUOW() as uow:
-            repo = ReleaseRepository(session=uow.session)
-            releases, total = await repo.get_active_releases(offset=offset, limit=limit)
-            response_result = PaginatedResponse[ReleasePublicResponse](
-                items=[ReleasePublicResponse.model_validate(release) for release in releases],
-                total=total,
-                offset=offset,
-                limit=limit,
-            )
-            await cache.set(cache_key, response_result.model_dump(mode="json"))
-            logger.info(
-                "[API] Public: Releases got from DB and cached: %i releases | total: %i | latest: %s",
-                len(response_result.items),
-                total,
-                _get_latest_version(response_result) or "N/A",
-            )
+        response_result = await _load_release_page(cache, cache_key, offset=offset, limit=limit)
         response_status = 200
 
+    latest_version = _get_latest_version(response_result)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[API] Public: Releases got from %s (offset=%i, limit=%i): %i releases | latest: %s",
+            "cache" if cached_result is not None else "DB",
+            offset,
+            limit,
+            len(response_result.items),
+            latest_version or "N/A",
+        )
+
     # Log request to analytics (non-blocking)
     if settings.flags.api_analytics_enabled:
         logger.debug("[API] Public: Logging request to analytics")
-        analytics_service = AnalyticsService(clickhouse_settings=get_clickhouse_settings())
-        analytics_service.log_request_async(
-            background_tasks=background_tasks,
-            request=ReleasesAnalyticsSchema(
+        get_analytics_writer().enqueue(
+            ReleasesAnalyticsSchema(
                 timestamp=utcnow(skip_tz=False),
                 client_version=current_version,
                 client_install_id=install_id,
@@ -163,11 +140,11 @@ async def get_active_releases(
                 client_ip_address=request.client.host if request.client else None,
                 client_user_agent=request.headers.get("user-agent"),
                 client_ref_url=request.headers.get("referer"),
-                response_latest_version=_get_latest_version(response_result),
+                response_latest_version=latest_version,
                 response_status=response_status,
-                response_time_ms=(time.time() - start_time) * 1000,
-                response_from_cache=bool(cached_result),
-            ),
+                response_time_ms=(time.monotonic() - start_time) * 1000,
+                response_from_cache=cached_result is not None,
+            )
         )
     else:
         logger.debug("[API] Public: Analytics disabled, skipping log request")
@@ -175,6 +152,35 @@ async def get_active_releases(
     return response_result
 
 
+async def _load_release_page(
+    cache: CacheProtocol,
+    cache_key: str,
+    offset: int,
+    limit: int,
+) -> _ReleasesPage:
+    """
+    Get active releases page from DB and put it to the cache.
+    Concurrent misses for the same page share a single DB query.
+    """
+
+    async def load() -> _ReleasesPage:
+        # TODO: cover with tests and refactor (use service layer instead)
+        async with SASessionUOW() as uow:
+            repo = ReleaseRepository(session=uow.session)
+            releases, total = await repo.get_active_releases(offset=offset, limit=limit)
+
+        page = _ReleasesPage(
+            items=_RELEASES_ADAPTER.validate_python(releases),
+            total=total,
+            offset=offset,
+            limit=limit,
+        )
+        await cache.set(cache_key, page, ttl=CACHE_TTL_ACTIVE_RELEASES_PAGE)
+        return page
+
+    return await _release_pages_flight.do(cache_key, load)
+
+
 def _get_latest_version(response_result: PaginatedResponse[ReleasePublicResponse]) -> str | None:
     """Get latest release version from a paginated release response."""
     return response_result.items[0].version if response_result.items else None
@@ -183,12 +189,18 @@ def _get_latest_version(response_result: PaginatedResponse[ReleasePublicResponse
 def _get_cached_release_page(
     cached_data: Any,
 ) -> PaginatedResponse[ReleasePublicResponse] | None:
-    """Validate cached release page payload and ignore unusable cache entries."""
+    """
+    Get release page from cached value: in-memory cache keeps already validated pages,
+    Redis payload (dict) is validated and unusable cache entries are ignored.
+    """
+    if isinstance(cached_data, PaginatedResponse):
+        return cached_data
+
     if not cached_data or not isinstance(cached_data, dict):
         return None
 
     try:
-        return PaginatedResponse[ReleasePublicResponse].model_validate(cached_data)
+        return _ReleasesPage.model_validate(cached_data)
     except ValidationError:
         logger.warning("[API] Public: Invalid active releases cache payload ignored")
         return None
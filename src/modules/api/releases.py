@@ -1,5 +1,6 @@
 import logging
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from pydantic import TypeAdapter
 
 from src.models import (
     ReleaseCreate,
@@ -8,23 +9,22 @@ from src.models import (
     ReleaseResponse,
     PaginatedResponse,
 )
-from src.modules.api import ErrorHandlingBaseRoute
 from src.db.repositories import ReleaseRepository
 from src.db.services import SASessionUOW
 from src.db.dependencies import get_uow_with_session
+from src.exceptions import InstanceLookupError
 from src.services.cache import invalidate_release_cache
 from src.utils import utcnow
 
 __all__ = ("admin_router",)
 
 logger = logging.getLogger(__name__)
-
+_RELEASES_ADAPTER: TypeAdapter[list[ReleaseResponse]] = TypeAdapter(list[ReleaseResponse])
 
 admin_router = APIRouter(
     prefix="/releases",
     tags=["releases"],
     responses={404: {"description": "Not found"}},
-    route_class=ErrorHandlingBaseRoute,
 )
 
 
@@ -42,7 +42,7 @@ async def list_releases(
         releases, total = await repo.get_all_paginated(offset=offset, limit=limit)
 
         return PaginatedResponse[ReleaseResponse](
-            items=[ReleaseResponse.model_validate(release) for release in releases],
+            items=_RELEASES_ADAPTER.validate_python(releases),
             total=total,
             offset=offset,
             limit=limit,
@@ -67,6 +67,7 @@ async def get_release(
 @admin_router.post("/", response_model=ReleaseDetailsResponse, status_code=status.HTTP_201_CREATED)
 async def create_release(
     release_data: ReleaseCreate,
+    background_tasks: BackgroundTasks,
     uow: SASessionUOW = Depends(get_uow_with_session),
 ) -> ReleaseDetailsResponse:
     """Create a new release (admin endpoint, requires authentication)"""
@@ -81,7 +82,7 @@ async def create_release(
         release = await repo.create(value=release_info)
         uow.mark_for_commit()
 
-    await invalidate_release_cache()
+    background_tasks.add_task(invalidate_release_cache)
     logger.info("[API] Release created: '%s'", release.version)
     return ReleaseDetailsResponse.model_validate(release)
 
@@ -90,6 +91,7 @@ async def create_release(
 async def update_release(
     release_id: int,
     release_data: ReleaseUpdate,
+    background_tasks: BackgroundTasks,
     uow: SASessionUOW = Depends(get_uow_with_session),
 ) -> ReleaseDetailsResponse:
     """Update release by ID (admin endpoint, requires authentication)"""
@@ -100,7 +102,7 @@ async def update_release(
         await repo.update(release, **update_dict)
         uow.mark_for_commit()
 
-    await invalidate_release_cache()
+    background_tasks.add_task(invalidate_release_cache)
     logger.info("[API] Release updated: '%s'", release)
     return ReleaseDetailsResponse.model_validate(release)
 
@@ -108,17 +110,21 @@ async def update_release(
 @admin_router.post("/{release_id}/activate/", response_model=ReleaseDetailsResponse)
 async def activate_release(
     release_id: int,
+    background_tasks: BackgroundTasks,
     uow: SASessionUOW = Depends(get_uow_with_session),
 ) -> ReleaseDetailsResponse:
     """Activate release by ID (admin endpoint, requires authentication)"""
     logger.debug("[API] Activating release by ID: '%s'", release_id)
     async with uow:
         repo = ReleaseRepository(session=uow.session)
-        release = await repo.get(release_id)
-        await repo.set_active([release_id], is_active=True)
+        releases = await repo.set_active_returning([release_id], is_active=True)
+        if not releases:
+            raise InstanceLookupError(f"Instance with ID {release_id} not found")
+
+        release = releases[0]
         uow.mark_for_commit()
 
-    await invalidate_release_cache()
+    background_tasks.add_task(invalidate_release_cache)
     logger.info("[API] Release activated: '%s'", release.version)
     return ReleaseDetailsResponse.model_validate(release)
 
@@ -126,17 +132,21 @@ async def activate_release(
 @admin_router.post("/{release_id}/deactivate/", response_model=ReleaseDetailsResponse)
 async def deactivate_release(
     release_id: int,
+    background_tasks: BackgroundTasks,
     uow: SASessionUOW = Depends(get_uow_with_session),
 ) -> ReleaseDetailsResponse:
     """Deactivate release by ID (admin endpoint, requires authentication)"""
     logger.debug("[API] Deactivating release by ID: '%s'", release_id)
     async with uow:
         repo = ReleaseRepository(session=uow.session)
-        release = await repo.get(release_id)
-        await repo.set_active([release_id], is_active=False)
+        releases = await repo.set_active_returning([release_id], is_active=False)
+        if not releases:
+            raise InstanceLookupError(f"Instance with ID {release_id} not found")
+
+        release = releases[0]
         uow.mark_for_commit()
 
-    await invalidate_release_cache()
+    background_tasks.add_task(invalidate_release_cache)
     logger.info("[API] Release deactivated: '%s'", release.version)
     return ReleaseDetailsResponse.model_validate(release)
 
@@ -144,6 +154,7 @@ async def deactivate_release(
 @admin_router.delete("/{release_id}/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_release(
     release_id: int,
+    background_tasks: BackgroundTasks,
     uow: SASessionUOW = Depends(get_uow_with_session),
 ) -> None:
     """Delete release by ID (admin endpoint, requires authentication)"""
@@ -155,6 +166,6 @@ async def delete_release(
         await repo.delete(release)
         uow.mark_for_commit()
 
-    await invalidate_release_cache()
+    background_tasks.add_task(invalidate_release_cache)
     logger.info("[API] Release deleted: '%s'", release.version)
     return None
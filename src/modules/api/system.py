@@ -3,7 +3,6 @@ from datetime import datetime
 from fastapi import APIRouter
 
 from src.models import HealthCheck
-from src.modules.api import ErrorHandlingBaseRoute
 
 __all__ = ("router",)
 
@@ -12,7 +11,6 @@ router = APIRouter(
     prefix="/system",
     tags=["system"],
     responses={404: {"description": "Not found"}},
-    route_class=ErrorHandlingBaseRoute,
 )
 
 
@@ -1,9 +1,11 @@
+import json
+import base64
+import functools
 import dataclasses
-import uuid
-import random
+import secrets
 import hashlib
 import datetime
-from typing import NamedTuple
+from typing import NamedTuple, TypedDict, cast
 
 import jwt
 from fastapi import Security
@@ -11,9 +13,11 @@ from fastapi.security import APIKeyHeader
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
 
+from src.constants import CACHE_KEY_API_TOKEN, CACHE_TTL_API_TOKEN, CACHE_TTL_API_TOKEN_UNKNOWN
 from src.settings import SettingsDep
 from src.db.repositories import TokenRepository
 from src.db.services import SASessionUOW, logger
+from src.services.cache import get_cache
 
 __all__ = (
     "make_api_token",
@@ -31,6 +35,15 @@ class GeneratedToken(NamedTuple):
     hashed_value: str
 
 
+class TokenState(TypedDict):
+    """Cacheable result of API token lookup"""
+
+    found: bool
+    is_active: bool
+    user_is_active: bool
+    user: str
+
+
 @dataclasses.dataclass
 class JWTPayload:
     sub: str
@@ -95,8 +108,8 @@ def make_api_token(
         TokenInfo - tuple of token and its hashed value
     """
     expires_at = expires_at or datetime.datetime.max
-    # just random id, that will be hashed to retrieve from DB in an auth process
-    token_identifier = f"{random.randint(100, 999):0>3}{uuid.uuid4().hex[-6:]}"
+    # just random id (CSPRNG), that will be hashed to retrieve from DB in an auth process
+    token_identifier = secrets.token_hex(5)
     encrypted_token = jwt_encode(
         payload=JWTPayload(sub=token_identifier, exp=expires_at),
         expires_at=expires_at,
@@ -136,14 +149,18 @@ def decode_api_token(token: str, settings: SettingsDep) -> JWTPayload:
         PayloadTokenInfo - payload of the token
     """
     logger.debug("[auth] Decoding token: '%s'", token)
-    just_for_header_token = jwt_encode(payload=JWTPayload(sub="example"), settings=settings)
-    header_part, _, _ = just_for_header_token.split(".")
+    header_part = _jwt_header_for(settings.jwt_algorithm)
     token, sign_len_prefix = token[:-3], token[-3:]  # last 3 symbols contain len of signature
-    if not sign_len_prefix.isnumeric():
+    # isascii() keeps int() away from non-ASCII digits (like "²"), isnumeric() passes them
+    if not (sign_len_prefix.isascii() and sign_len_prefix.isdigit()):
         logger.error("[auth] Unexpected sign len prefix detected: '%s'", sign_len_prefix)
         raise HTTPException(status_code=401, detail="Invalid token signature")
 
     signature_length = int(sign_len_prefix)
+    if not 0 < signature_length < len(token):
+        logger.error("[auth] Unexpected signature length detected: %i", signature_length)
+        raise HTTPException(status_code=401, detail="Invalid token signature")
+
     payload_part, signature_part = token[:-signature_length], token[-signature_length:]
 
     checking_token = f"{header_part}.{payload_part}.{signature_part}"
@@ -160,6 +177,16 @@ def decode_api_token(token: str, settings: SettingsDep) -> JWTPayload:
     return payload
 
 
+@functools.lru_cache(maxsize=4)
+def _jwt_header_for(algorithm: str) -> str:
+    """
+    Returns encoded JWT header part (the same as PyJWT produces for the algorithm).
+    Header is cut from the API tokens, so it has to be restored before decoding.
+    """
+    header = json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(header.encode()).decode().rstrip("=")
+
+
 def hash_token(token: str) -> str:
     """
     Hashes token and returns hashed value.
@@ -198,20 +225,45 @@ async def verify_api_token(
         raise HTTPException(status_code=401, detail="Not authenticated: token has no identity")
 
     hashed_token = hash_token(raw_token_identity)
-
-    async with SASessionUOW() as uow:
-        token = await TokenRepository(session=uow.session).get_by_token(hashed_token)
-
-    logger.info("[auth] Verification: token extracted '%s'", token)
-    if not token:
+    token_state = await _get_token_state(
+        hashed_token, use_cache=settings.flags.api_token_cache_enabled
+    )
+    if not token_state["found"]:
         raise HTTPException(status_code=401, detail="Not authenticated: unknown token")
 
-    if not token.is_active:
+    if not token_state["is_active"]:
         raise HTTPException(status_code=401, detail="Not authenticated: inactive token")
 
-    if not token.user.is_active:
+    if not token_state["user_is_active"]:
         raise HTTPException(status_code=401, detail="Not authenticated: user is not active")
 
-    logger.info("[auth] Verified token for %(user)s", {"user": token.user})
+    logger.info("[auth] Verified token for %(user)s", {"user": token_state["user"]})
 
     return auth_token
+
+
+async def _get_token_state(hashed_token: str, use_cache: bool) -> TokenState:
+    """
+    Get API token state from DB (or from cache).
+    Unknown tokens are cached for a few seconds only: repeated probing doesn't reach DB.
+    """
+    cache = get_cache()
+    cache_key = CACHE_KEY_API_TOKEN.format(hashed_token=hashed_token)
+    if use_cache and (cached_state := await cache.get(cache_key)) is not None:
+        return cast(TokenState, cached_state)
+
+    async with SASessionUOW(read_only=True) as uow:
+        token = await TokenRepository(session=uow.session).get_by_token(hashed_token)
+
+    logger.info("[auth] Verification: token extracted '%s'", token)
+    token_state = TokenState(
+        found=token is not None,
+        is_active=token is not None and token.is_active,
+        user_is_active=token is not None and token.user.is_active,
+        user=str(token.user) if token is not None else "",
+    )
+    if use_cache:
+        ttl = CACHE_TTL_API_TOKEN if token_state["found"] else CACHE_TTL_API_TOKEN_UNKNOWN
+        await cache.set(cache_key, dict(token_state), ttl=ttl)
+
+    return token_state
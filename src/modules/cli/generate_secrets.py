@@ -27,9 +27,18 @@ def main() -> None:
     ]
 
     # Write to .env file
+    env_file_existed = ENV_FILE_PATH.exists()
     try:
-        # Append secrets to .env file
-        with open(ENV_FILE_PATH, "a", encoding="utf-8") as env_file:
+        # Append secrets to .env file (new file is created with 600 permissions at once)
+        fd = os.open(ENV_FILE_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            env_file = os.fdopen(fd, "a", encoding="utf-8")
+        except Exception:
+            # the file object owns fd only when it was created
+            os.close(fd)
+            raise
+
+        with env_file:
             env_file.write("\n".join(env_secrets) + "\n")
 
         print(f"✅ Secrets written to {ENV_FILE_PATH}")
@@ -38,7 +47,10 @@ def main() -> None:
         print(f"⚠️  Warning: Could not write to .env file: {e}")
 
     else:
-        # Now change the permissions of the .env file to 600
+        if not env_file_existed:
+            return
+
+        # Existing .env file could have wider permissions: change them to 600
         try:
             os.chmod(ENV_FILE_PATH, 0o600)
             print(f"✅ Permissions changed to 600 for {ENV_FILE_PATH}")
@@ -1,13 +1,28 @@
+import asyncio
+import dataclasses
 import logging
-from typing import Any
+import operator
+import time
+from functools import cache
+from typing import Any, Sequence
 
 from src.db.clickhouse import get_clickhouse_client, ReleasesAnalyticsSchema
-from src.settings.db import ClickHouseSettings
-from starlette.background import BackgroundTasks
+from src.settings.db import ClickHouseSettings, get_clickhouse_settings
 
 logger = logging.getLogger(__name__)
 
-__all__ = ("AnalyticsService",)
+__all__ = (
+    "AnalyticsService",
+    "AnalyticsWriter",
+    "AnalyticsWriterStats",
+    "start_analytics_writer",
+    "stop_analytics_writer",
+    "get_analytics_writer",
+)
+ANALYTICS_QUEUE_MAX_SIZE: int = 10_000
+ANALYTICS_COLUMNS: tuple[str, ...] = tuple(ReleasesAnalyticsSchema.model_fields)
+_COLUMN_GETTERS = tuple(operator.attrgetter(column) for column in ANALYTICS_COLUMNS)
+_timestamp_key = operator.attrgetter("timestamp")
 
 
 class AnalyticsService:
@@ -18,46 +33,27 @@ class AnalyticsService:
         self._analytics_table_name = clickhouse_settings.analytics_table_name
         self._database = clickhouse_settings.database
 
-    def log_request_async(
-        self,
-        background_tasks: BackgroundTasks,
-        request: ReleasesAnalyticsSchema,
-    ) -> None:
+    async def log_batch(self, requests: Sequence[ReleasesAnalyticsSchema]) -> None:
         """
-        Log API request to ClickHouse asynchronously
-        """
-        background_tasks.add_task(self._log_request, request)
-
-    async def _log_request(self, request: ReleasesAnalyticsSchema) -> None:
-        """
-        Log API request to ClickHouse
+        Log API requests to ClickHouse with a single multi-row insert
 
         Args:
-            request: AnalyticsRequest namedtuple with request data
+            requests: Analytics rows collected by AnalyticsWriter
         """
-        try:
-            client = await get_clickhouse_client()
-            data = request.model_dump()
-            insert_columns, insert_cells = [], []
-            for key, value in data.items():
-                insert_columns.append(key)
-                insert_cells.append(value)
-
-            await client.insert(
-                table=self._analytics_table_name,
-                data=[insert_cells],
-                column_names=insert_columns,
-            )
-            logger.info(
-                "[Analytics] Logged request: latest-ver: %s | install-id: %s | status: %d",
-                request.response_latest_version,
-                request.client_install_id,
-                request.response_status,
-            )
-        except Exception as e:
-            # Don't fail the request if analytics logging fails
-            logger.warning("[Analytics] Failed to log request: %r", e)
-            raise e
+        client = await get_clickhouse_client()
+        # table is ordered by timestamp: presorted (nearly sorted already) parts are cheaper to merge
+        requests = sorted(requests, key=_timestamp_key)
+        # column-oriented data matches ClickHouse Native format (no row -> column transposing)
+        # precomputed getters: plain attribute access (no model_dump()/getattr() per value)
+        insert_columns = [list(map(getter, requests)) for getter in _COLUMN_GETTERS]
+        await client.insert(
+            table=self._analytics_table_name,
+            data=insert_columns,
+            column_names=ANALYTICS_COLUMNS,
+            column_oriented=True,
+            settings=self._clickhouse_settings.insert_settings,
+        )
+        logger.info("[Analytics] Logged %i requests", len(requests))
 
     async def get_requests_over_time(
         self, hours: int = 24, group_by: str = "hour"
@@ -281,3 +277,153 @@ class AnalyticsService:
         """
         result = await client.query(query)
         return [{"bucket": int(row[0]), "count": row[1]} for row in result.result_rows]
+
+
+@dataclasses.dataclass(frozen=True)
+class AnalyticsWriterStats:
+    queue_size: int
+    dropped_rows: int
+    failed_rows: int
+    last_flush_rows: int
+    last_flush_latency_ms: float
+
+
+class AnalyticsWriter:
+    """
+    Buffers analytics rows in memory and writes them to ClickHouse in batches
+    (flushes when batch_size rows are collected or flush_interval is elapsed)
+    """
+
+    def __init__(
+        self,
+        service: AnalyticsService,
+        batch_size: int,
+        flush_interval: float,
+        max_queue_size: int = ANALYTICS_QUEUE_MAX_SIZE,
+    ) -> None:
+        self._service = service
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_queue_size = max_queue_size
+        # queue is bound to the running loop, so it is created on start
+        self._queue: asyncio.Queue[ReleasesAnalyticsSchema] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._batch: list[ReleasesAnalyticsSchema] = []
+        self._dropped_rows = 0
+        self._failed_rows = 0
+        self._last_flush_rows = 0
+        self._last_flush_latency_ms = 0.0
+
+    @property
+    def stats(self) -> AnalyticsWriterStats:
+        """Writer's backlog and flush metrics (for observability)"""
+        return AnalyticsWriterStats(
+            queue_size=self._queue.qsize() if self._queue is not None else 0,
+            dropped_rows=self._dropped_rows,
+            failed_rows=self._failed_rows,
+            last_flush_rows=self._last_flush_rows,
+            last_flush_latency_ms=self._last_flush_latency_ms,
+        )
+
+    def start(self) -> None:
+        """Start background flushing task (requires running event loop)"""
+        if self._task is not None:
+            logger.warning("[Analytics] Writer is already started")
+            return
+
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._task = asyncio.create_task(self._run(self._queue), name="analytics-writer")
+        logger.info("[Analytics] Writer started (batch size: %i)", self._batch_size)
+
+    async def stop(self) -> None:
+        """Stop background task and flush all buffered rows"""
+        if self._task is None or self._queue is None:
+            return
+
+        # new rows are skipped from now on, already queued ones are drained by the task
+        queue, self._queue = self._queue, None
+        # no cancellation: the running flush completes and the rest of the queue is flushed
+        queue.shutdown()
+        await self._task
+        self._task = None
+        logger.info("[Analytics] Writer stopped")
+
+    def enqueue(self, request: ReleasesAnalyticsSchema) -> None:
+        """Put analytics row to the buffer (never blocks, drops the oldest row on overflow)"""
+        if self._queue is None:
+            logger.debug("[Analytics] Writer is not started, skipping request logging")
+            return
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._dropped_rows += 1
+            logger.warning(
+                "[Analytics] Queue is full, the oldest row is dropped (dropped total: %i)",
+                self._dropped_rows,
+            )
+
+        self._queue.put_nowait(request)
+
+    async def _run(self, queue: asyncio.Queue[ReleasesAnalyticsSchema]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                self._batch.append(await queue.get())
+            except asyncio.QueueShutDown:
+                # writer is stopped and the queue is drained
+                return
+
+            deadline = loop.time() + self._flush_interval
+            while len(self._batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except (TimeoutError, asyncio.QueueShutDown):
+                    break
+
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+        start_time = time.monotonic()
+        try:
+            await self._service.log_batch(batch)
+        except Exception as exc:
+            # Don't break the writer if analytics logging fails
+            self._failed_rows += len(batch)
+            logger.warning("[Analytics] Failed to log %i requests: %r", len(batch), exc)
+        else:
+            self._last_flush_rows = len(batch)
+            self._last_flush_latency_ms = (time.monotonic() - start_time) * 1000
+            logger.debug(
+                "[Analytics] Flushed %i rows in %.1f ms (queue size: %i)",
+                self._last_flush_rows,
+                self._last_flush_latency_ms,
+                self._queue.qsize() if self._queue is not None else 0,
+            )
+
+
+def start_analytics_writer() -> None:
+    """Start batched analytics writer"""
+    get_analytics_writer().start()
+
+
+async def stop_analytics_writer() -> None:
+    """Stop batched analytics writer and flush buffered rows"""
+    await get_analytics_writer().stop()
+
+
+@cache
+def get_analytics_writer() -> AnalyticsWriter:
+    """Get batched analytics writer instance (created on the first call)"""
+    clickhouse_settings = get_clickhouse_settings()
+    return AnalyticsWriter(
+        AnalyticsService(clickhouse_settings),
+        batch_size=clickhouse_settings.insert_batch_size,
+        flush_interval=clickhouse_settings.insert_flush_interval,
+    )
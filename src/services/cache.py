@@ -1,12 +1,30 @@
-import json
 import time
+import heapq
+import asyncio
 import logging
 import contextlib
-from typing import Generator, Protocol, Any, TypeAlias, Literal
+from collections import OrderedDict, defaultdict
+from typing import (
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    Protocol,
+    Any,
+    TypeAlias,
+    TypeVar,
+    Literal,
+)
 
 import redis.asyncio as aioredis
-
-from src.constants import CACHE_KEY_ACTIVE_RELEASES_PAGE
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from src.constants import (
+    CACHE_KEY_ACTIVE_RELEASES_PAGE,
+    CACHE_KEY_API_TOKEN,
+    CACHE_KEY_DASHBOARD_COUNTS,
+)
 from src.db.redis import get_redis_client
 from src.exceptions import CacheBackendError
 from src.settings import get_app_settings
@@ -14,9 +32,13 @@ from src.utils import singleton, cut_string
 
 logger = logging.getLogger(__name__)
 DEFAULT_CACHE_TTL: int = 3600
-CacheValueType: TypeAlias = str | list[dict[str, Any]] | dict[str, Any]
+DEFAULT_CACHE_MAX_SIZE: int = 10_000
+REDIS_SCAN_COUNT: int = 500
+# BaseModel values are kept as-is in memory and stored as JSON in Redis
+CacheValueType: TypeAlias = str | list[dict[str, Any]] | dict[str, Any] | BaseModel
 type CacheOperation = Literal["get", "set", "invalidate", "invalidate_pattern"]
 type CacheBackend = Literal["redis", "memory"]
+T = TypeVar("T")
 
 
 class CacheProtocol(Protocol):
@@ -62,12 +84,18 @@ def cache_wrap_error(
 
 @singleton
 class InMemoryCache(CacheProtocol):
-    """Simple memory cache with TTL per key."""
+    """Simple memory cache with TTL per key (bounded: least recently used keys are evicted)."""
 
-    def __init__(self) -> None:
+    def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE) -> None:
         self._ttl: float = DEFAULT_CACHE_TTL
-        self._data: dict[str, CacheValueType] = {}
-        self._last_update: dict[str, float] = {}
+        self._max_size: int = max_size
+        self._now: Callable[[], float] = time.monotonic
+        # key -> (expires_at, value), ordered from the least to the most recently used
+        self._data: OrderedDict[str, tuple[float, CacheValueType]] = OrderedDict()
+        # min-heap of (expires_at, key): expired keys are swept without full scans
+        self._expiry: list[tuple[float, str]] = []
+        # keys grouped by the first "<segment>_": prefix invalidation doesn't scan all keys
+        self._prefix_buckets: defaultdict[str, set[str]] = defaultdict(set)
 
     async def get(self, key: str) -> CacheValueType | None:
         """
@@ -76,29 +104,74 @@ class InMemoryCache(CacheProtocol):
         :param key: Cache key to look up
         :return: Cached value if exists and not expired, None otherwise
         """
-        if key not in self._data:
+        now = self._now()
+        self._sweep(now)
+        item = self._data.get(key)
+        if item is None:
             return None
 
-        if time.monotonic() - self._last_update[key] > self._ttl:
-            del self._data[key]
-            del self._last_update[key]
+        expires_at, value = item
+        if now > expires_at:
+            self._delete(key)
             return None
 
+        self._data.move_to_end(key)
         logger.debug("Cache[memory]: got value for key %s", key)
-        return self._data[key]
+        return value
 
     async def set(self, key: str, value: CacheValueType, ttl: int | None = None) -> None:
         """
-        Set new cache value for key and update timestamp.
+        Set new cache value for key and update its expiration time.
 
         :param key: Cache key to store value
         :param value: Value to cache
-        :param ttl: TTL to use (ignored for memory cache, uses default TTL)
+        :param ttl: TTL in seconds (uses default TTL if None)
         """
-        self._data[key] = value
-        self._last_update[key] = time.monotonic()
+        now = self._now()
+        expires_at = now + (ttl or self._ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        self._prefix_buckets[self._bucket(key)].add(key)
+        heapq.heappush(self._expiry, (expires_at, key))
+        self._sweep(now)
+        while len(self._data) > self._max_size:
+            evicted_key = next(iter(self._data))
+            self._delete(evicted_key)
+            logger.debug("Cache[memory]: evicted key %s", evicted_key)
+
         logger.debug("Cache[memory]: set value for key %s | value: %s", key, value)
 
+    @staticmethod
+    def _bucket(key_or_prefix: str) -> str:
+        """Get bucket name: "active_releases_page_0_10" -> "active_" """
+        segment, separator, _ = key_or_prefix.partition("_")
+        return f"{segment}{separator}"
+
+    def _delete(self, key: str) -> None:
+        """Remove key with its prefix bucket entry"""
+        if self._data.pop(key, None) is None:
+            return
+
+        bucket = self._bucket(key)
+        bucket_keys = self._prefix_buckets[bucket]
+        bucket_keys.discard(key)
+        if not bucket_keys:
+            del self._prefix_buckets[bucket]
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired keys (amortized by get()/set() calls, untouched keys don't linger)"""
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry)
+            item = self._data.get(key)
+            # heap entry may be outdated: the key was overwritten or already removed
+            if item is not None and item[0] == expires_at:
+                self._delete(key)
+
+        # outdated entries with long TTL: rebuild the heap from live keys only
+        if len(self._expiry) > 2 * max(len(self._data), self._max_size):
+            self._expiry = [(expires_at, key) for key, (expires_at, _) in self._data.items()]
+            heapq.heapify(self._expiry)
+
     async def invalidate(
         self,
         key: str | None = None,
@@ -114,17 +187,21 @@ class InMemoryCache(CacheProtocol):
         if pattern == "*":
             logger.debug("Cache[memory]: invalidated all keys")
             self._data.clear()
-            self._last_update.clear()
+            self._expiry.clear()
+            self._prefix_buckets.clear()
             return
 
         elif pattern:
             prefix = pattern.removesuffix("*")
-            keys_to_remove = [key for key in self._data.keys() if key.startswith(prefix)]
+            # prefix without "_" may span several buckets: check all keys then
+            candidate_keys = (
+                self._prefix_buckets.get(self._bucket(prefix), ())
+                if "_" in prefix
+                else self._data.keys()
+            )
+            keys_to_remove = [key for key in candidate_keys if key.startswith(prefix)]
             for key in keys_to_remove:
-                if key in self._data:
-                    del self._data[key]
-                if key in self._last_update:
-                    del self._last_update[key]
+                self._delete(key)
 
             if keys_to_remove:
                 logger.debug(
@@ -133,9 +210,7 @@ class InMemoryCache(CacheProtocol):
                     prefix,
                 )
         elif key:
-            if key in self._data:
-                del self._data[key]
-                del self._last_update[key]
+            self._delete(key)
 
         else:
             raise ValueError("Cache[memory]: key or pattern is required for invalidation")
@@ -145,10 +220,10 @@ class InMemoryCache(CacheProtocol):
 class RedisCache(CacheProtocol):
     """Redis-based cache implementation with JSON serialization and async operations."""
 
-    def __init__(self, client: aioredis.Redis) -> None:
+    def __init__(self, client: aioredis.Redis | None = None) -> None:
         """Initialize Redis cache client.
 
-        :param client: Redis client instance
+        :param client: Redis client instance (the current app's client is used if not passed)
         """
         self._client = client
         self._default_ttl: int = DEFAULT_CACHE_TTL
@@ -156,11 +231,11 @@ class RedisCache(CacheProtocol):
     @property
     def client(self) -> aioredis.Redis:
         """Get the Redis client instance from current context"""
-        if self._client is None:
-            logger.warning("Cache[redis]: Client is not initialized!")
-            raise RuntimeError("Client is not initialized. Make sure lifespan is properly set up.")
+        if self._client is not None:
+            return self._client
 
-        return self._client
+        # resolved per operation: the client is re-created on each redis (re)initialization
+        return get_redis_client()
 
     async def get(self, key: str) -> CacheValueType | None:
         """
@@ -174,7 +249,7 @@ class RedisCache(CacheProtocol):
             if value is None:
                 return None
 
-            decoded: CacheValueType = json.loads(value)
+            decoded: CacheValueType = from_json(value)
 
         logger.debug(
             "Cache[redis:get] got value for key %s | value: %s",
@@ -193,14 +268,15 @@ class RedisCache(CacheProtocol):
         """
         ttl_seconds = ttl or self._default_ttl
         with cache_wrap_error("set", backend="redis"):
-            serialized = json.dumps(value)
+            # pydantic-core serializes models and plain structures (bytes are stored as-is)
+            serialized = to_json(value)
             await self.client.setex(key, ttl_seconds, serialized)
 
         logger.debug(
             "Cache[redis:set] key %s | ttl: %i | value: %s",
             key,
             ttl_seconds,
-            cut_string(serialized, max_length=64),
+            cut_string(serialized.decode(), max_length=64),
         )
 
     async def invalidate(
@@ -224,22 +300,86 @@ class RedisCache(CacheProtocol):
 
             if pattern:
                 prefix = pattern.removesuffix("*")
-                keys_to_remove = [key for key in await self.client.keys(pattern)]
-                if keys_to_remove:
-                    await self.client.delete(*keys_to_remove)
+                # SCAN doesn't block the server like KEYS, UNLINK frees memory in background
+                # (UNLINKs are buffered in a pipeline and flushed every REDIS_SCAN_COUNT keys)
+                removed_count, buffered_count = 0, 0
+                async with self.client.pipeline(transaction=False) as pipe:
+                    async for found_key in self.client.scan_iter(
+                        match=pattern, count=REDIS_SCAN_COUNT
+                    ):
+                        pipe.unlink(found_key)
+                        buffered_count += 1
+                        if buffered_count >= REDIS_SCAN_COUNT:
+                            removed_count += sum(await pipe.execute())
+                            buffered_count = 0
+
+                    if buffered_count:
+                        removed_count += sum(await pipe.execute())
+
+                if removed_count:
                     logger.debug(
                         "Cache[redis]: invalidated %i keys with prefix %s",
-                        len(keys_to_remove),
+                        removed_count,
                         prefix,
                     )
 
             elif key:
                 logger.debug("Cache[redis]: invalidating key %s", key)
-                await self.client.delete(key)
+                await self.client.unlink(key)
             else:
                 raise ValueError("Cache[redis]: key or pattern is required for invalidation")
 
 
+class SingleFlight(Generic[T]):
+    """
+    Collapses concurrent calls with the same key into a single execution:
+    the first caller runs the loader, the rest await its result (cache stampede protection).
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[T]] = {}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run loader for the key or join the already running one.
+
+        :param key: Key of the loading value (e.g. cache key)
+        :param loader: Coroutine function that produces the value
+        :return: Loaded value
+        """
+        if (future := self._inflight.get(key)) is not None:
+            logger.debug("Cache[single-flight]: joining in-flight load for key %s", key)
+            try:
+                # shield: cancelling one of the waiters must not cancel the shared load
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                current_task = asyncio.current_task()
+                if not future.cancelled() or (current_task and current_task.cancelling()):
+                    raise
+
+                # the leader was cancelled (e.g. its client disconnected): load the value again
+                logger.debug("Cache[single-flight]: in-flight load for key %s is cancelled", key)
+                return await self.do(key, loader)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await loader()
+        except Exception as exc:
+            future.set_exception(exc)
+            # mark as retrieved: there may be no waiters for this exception
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+
 def get_cache(backend: Literal["redis", "memory"] = "redis") -> CacheProtocol:
     """Get cache instance based on configuration.
 
@@ -254,7 +394,7 @@ def get_cache(backend: Literal["redis", "memory"] = "redis") -> CacheProtocol:
 
     if settings.flags.use_redis:
         logger.debug("Cache: requested RedisCache and redis is enabled")
-        return RedisCache(get_redis_client())
+        return RedisCache()
 
     logger.debug("Cache: redis is disabled, returning InMemoryCache")
     return InMemoryCache()
@@ -266,4 +406,19 @@ async def invalidate_release_cache() -> None:
     # Invalidate all paginated cache keys
     cache: CacheProtocol = get_cache()
     await cache.invalidate(pattern=f"{prefix}*")
+    # admin dashboard counts depend on the same releases
+    await cache.invalidate(CACHE_KEY_DASHBOARD_COUNTS)
     logger.info("[CACHE] Invalidated: all paginated pages with prefix %s", prefix)
+
+
+async def invalidate_api_token_cache(hashed_token: str | None = None) -> None:
+    """Invalidate cached states of verified API tokens (all tokens or the given one)"""
+    cache: CacheProtocol = get_cache()
+    if hashed_token:
+        await cache.invalidate(CACHE_KEY_API_TOKEN.format(hashed_token=hashed_token))
+        logger.info("[CACHE] Invalidated: API token's state")
+        return
+
+    prefix = CACHE_KEY_API_TOKEN.replace("{hashed_token}", "")
+    await cache.invalidate(pattern=f"{prefix}*")
+    logger.info("[CACHE] Invalidated: all API tokens with prefix %s", prefix)
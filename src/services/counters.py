@@ -2,7 +2,9 @@ import dataclasses
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.constants import CACHE_KEY_DASHBOARD_COUNTS, CACHE_TTL_DASHBOARD_COUNTS
 from src.db import ReleaseRepository
+from src.services.cache import get_cache
 
 
 @dataclasses.dataclass(frozen=True)
@@ -17,12 +19,23 @@ class AdminCounter:
 
     @classmethod
     async def get_stat(cls, session: AsyncSession) -> DashboardCounts:
-        """Get releases counts"""
+        """Get releases counts (cached, invalidated with releases cache)"""
+        cache = get_cache()
+        cached_counts = await cache.get(CACHE_KEY_DASHBOARD_COUNTS)
+        if isinstance(cached_counts, dict):
+            return DashboardCounts(**cached_counts)
+
         release_repository = ReleaseRepository(session)
         releases = await release_repository.group_by_active()
 
-        return DashboardCounts(
+        counts = DashboardCounts(
             total_releases=releases.active + releases.inactive,
             active_releases=releases.active,
             inactive_releases=releases.inactive,
         )
+        await cache.set(
+            CACHE_KEY_DASHBOARD_COUNTS,
+            dataclasses.asdict(counts),
+            ttl=CACHE_TTL_DASHBOARD_COUNTS,
+        )
+        return counts
@@ -1,12 +1,35 @@
 import logging
+from typing import AsyncIterator
 
 import httpx
+from starlette.background import BackgroundTask
 from starlette.requests import Request
 from starlette.responses import Response, StreamingResponse
 
 from src.constants import PROXY_EXCLUDED_REQUEST_HEADERS, PROXY_EXCLUDED_RESPONSE_HEADERS
 
 logger = logging.getLogger(__name__)
+_proxy_client: httpx.AsyncClient | None = None
+
+
+def get_proxy_client() -> httpx.AsyncClient:
+    """Get shared HTTP client (keeps connections to the proxied host alive between requests)"""
+    global _proxy_client
+    if _proxy_client is None or _proxy_client.is_closed:
+        _proxy_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    return _proxy_client
+
+
+async def close_proxy_client() -> None:
+    """Close shared HTTP client (if it was used)"""
+    global _proxy_client
+    if _proxy_client is not None:
+        await _proxy_client.aclose()
+        _proxy_client = None
 
 
 async def proxy(
@@ -31,37 +54,40 @@ async def proxy(
     if request.url.query:
         target_url += f"?{request.url.query}"
 
-    # Prepare headers for proxying
-    headers: dict[str, str] = {}
-    for key, value in request.headers.items():
-        if key.lower() not in PROXY_EXCLUDED_REQUEST_HEADERS:
-            headers[key] = value
+    # Prepare headers for proxying (starlette/httpx header keys are already lower-cased)
+    headers: dict[str, str] = {
+        key: value
+        for key, value in request.headers.items()
+        if key not in PROXY_EXCLUDED_REQUEST_HEADERS
+    }
 
     # Update Host header to target
     headers["Host"] = f"{proxy_host}:{proxy_port}"
 
-    # Get request body if present
-    body: bytes | None = None
+    # Stream request body (if present) to the target without buffering it in memory
+    body: AsyncIterator[bytes] | None = None
     content_length = request.headers.get("content-length")
-    if content_length and int(content_length) > 0:
-        body = await request.body()
+    if (content_length and int(content_length) > 0) or "transfer-encoding" in request.headers:
+        body = request.stream()
 
+    client = get_proxy_client()
     try:
-        # Make request to ClickHouse
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=headers,
-                content=body,
-                follow_redirects=False,
-            )
+        # Make request to ClickHouse (response body is read on demand)
+        proxy_request = client.build_request(
+            method=request.method,
+            url=target_url,
+            headers=headers,
+            content=body,
+        )
+        response = await client.send(proxy_request, stream=True, follow_redirects=False)
 
+        try:
             # Prepare response headers
-            response_headers: dict[str, str] = {}
-            for key, value in response.headers.items():
-                if key.lower() not in PROXY_EXCLUDED_RESPONSE_HEADERS:
-                    response_headers[key] = value
+            response_headers: dict[str, str] = {
+                key: value
+                for key, value in response.headers.items()
+                if key not in PROXY_EXCLUDED_RESPONSE_HEADERS
+            }
 
             # Handle redirects
             if response.status_code in (301, 302, 303, 307, 308):
@@ -74,20 +100,27 @@ async def proxy(
             # Create streaming response for large content
             if response.headers.get("content-type", "").startswith("text/"):
                 # For text content, read all at once
-                content = response.content
+                content = await response.aread()
+                await response.aclose()
+
                 return Response(
                     content=content,
                     status_code=response.status_code,
                     headers=response_headers,
                 )
-            else:
-                # For binary content, stream it
-                return StreamingResponse(
-                    response.iter_bytes(),
-                    status_code=response.status_code,
-                    headers=response_headers,
-                    media_type=response.headers.get("content-type"),
-                )
+
+            # For binary content, stream it (connection returns to the pool after the body is sent)
+            return StreamingResponse(
+                response.aiter_bytes(),
+                status_code=response.status_code,
+                headers=response_headers,
+                media_type=response.headers.get("content-type"),
+                background=BackgroundTask(response.aclose),
+            )
+        except BaseException:
+            # don't leak the upstream connection if the response can't be built
+            await response.aclose()
+            raise
 
     except httpx.TimeoutException:
         logger.error("[CH-Proxy] Timeout connecting to ClickHouse UI")
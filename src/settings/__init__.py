@@ -1,22 +1,24 @@
-from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, cast
 
 from fastapi import Depends
+from starlette.requests import Request
 
-from .app import AppSettings
-from .utils import prepare_settings
+from .app import AppSettings, get_app_settings
 
 __all__ = (
     "AppSettings",
     "SettingsDep",
     "get_app_settings",
+    "get_request_settings",
 )
 
 
-@lru_cache
-def get_app_settings() -> AppSettings:
-    """Prepares application settings from environment variables"""
-    return prepare_settings(AppSettings)
+async def get_request_settings(request: Request) -> AppSettings:
+    """
+    Returns settings bound to the application at startup
+    (async: FastAPI doesn't send this dependency to the threadpool on each request)
+    """
+    return cast(AppSettings, request.app.settings)
 
 
-SettingsDep = Annotated[AppSettings, Depends(get_app_settings)]
+SettingsDep = Annotated[AppSettings, Depends(get_request_settings)]
@@ -1,10 +1,8 @@
-from functools import lru_cache
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Annotated
 from zoneinfo import ZoneInfo
 import logging
 
-from fastapi import Depends
 from pydantic import SecretStr, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -19,6 +17,16 @@ logger = logging.getLogger(__name__)
 APP_DIR = Path(__file__).parent.parent
 
 
+@lru_cache(maxsize=32)
+def _get_zone_info(name: str) -> ZoneInfo | None:
+    """Resolve timezone by name (invalid names are cached too: logged once)"""
+    try:
+        return ZoneInfo(name)
+    except Exception as exc:
+        logger.error("AppSettings: unable to convert timezone to ZoneInfo: %s", exc)
+        return None
+
+
 class FlagsSettings(BaseSettings):
     """Implements settings which are loaded from environment variables"""
 
@@ -28,6 +36,7 @@ class FlagsSettings(BaseSettings):
     debug_mode: bool = False
     api_docs_enabled: bool = False
     api_cache_enabled: bool = True
+    api_token_cache_enabled: bool = True
     api_analytics_enabled: bool = True
     use_redis: bool = True
 
@@ -71,17 +80,10 @@ class AppSettings(BaseSettings):
         if v is None or v == "":
             return None
 
-        try:
-            return ZoneInfo(v)
-        except Exception as exc:
-            logger.error("AppSettings: unable to convert timezone to ZoneInfo: %s", exc)
-            return None
+        return _get_zone_info(v)
 
 
-@lru_cache
+@cache
 def get_app_settings() -> AppSettings:
     """Prepares application settings from environment variables"""
     return prepare_settings(AppSettings)
-
-
-SettingsDep = Annotated[AppSettings, Depends(get_app_settings)]
@@ -1,7 +1,8 @@
-from functools import lru_cache, cached_property
+from functools import cache, cached_property
 
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import URL
 
 from src.settings.utils import prepare_settings
 
@@ -21,11 +22,23 @@ class DBSettings(BaseSettings):
     name: str = "release_agent"
     pool_min_size: int | None = Field(default_factory=lambda: None, description="Pool Min Size")
     pool_max_size: int | None = Field(default_factory=lambda: None, description="Pool Max Size")
+    pool_pre_ping: bool = Field(default=True, description="Check connections on checkout")
+    pool_recycle: int = Field(default=1800, description="Recycle connections after (seconds)")
+    pool_use_lifo: bool = Field(default=True, description="Reuse the most recent connections")
     echo: bool = False
 
     @cached_property
     def dsn(self) -> str:
-        return f"{self.driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
+        """Database URL (credentials are URL-encoded, so '@', ':', '/' in password are safe)"""
+        url = URL.create(
+            drivername=self.driver,
+            username=self.user,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=self.name,
+        )
+        return url.render_as_string(hide_password=False)
 
 
 class RedisSettings(BaseSettings):
@@ -51,13 +64,13 @@ class RedisSettings(BaseSettings):
         return f"{self.host}:{self.port} (db={self.db})"
 
 
-@lru_cache
+@cache
 def get_db_settings() -> DBSettings:
     """Prepares database settings from environment variables"""
     return prepare_settings(DBSettings)
 
 
-@lru_cache
+@cache
 def get_redis_settings() -> RedisSettings:
     """Prepares redis settings from environment variables"""
     return prepare_settings(RedisSettings)
@@ -76,6 +89,18 @@ class ClickHouseSettings(BaseSettings):
     secure: bool = False
     timeout: int = 10
     analytics_table_name: str = "release_requests"
+    async_insert: bool = Field(
+        default=True,
+        description="Let ClickHouse buffer analytics inserts server-side (async_insert mode)",
+    )
+    insert_batch_size: int = Field(
+        default=1000,
+        description="Max analytics rows in a single insert (client-side batching)",
+    )
+    insert_flush_interval: float = Field(
+        default=0.5,
+        description="Max delay (seconds) before buffered analytics rows are inserted",
+    )
     ignore_domain: str = Field(
         default="domain.com",
         description="Domain to exclude from analytics queries (e.g. internal domain)",
@@ -86,6 +111,19 @@ class ClickHouseSettings(BaseSettings):
         """Get connection info string for logging"""
         return f"{self.host}:{self.port} (database={self.database})"
 
+    @cached_property
+    def insert_settings(self) -> dict[str, int]:
+        """Get query settings for analytics inserts"""
+        if not self.async_insert:
+            return {}
+
+        return {
+            "async_insert": 1,
+            "wait_for_async_insert": 0,
+            "async_insert_max_data_size": 10_000_000,
+            "async_insert_busy_timeout_ms": 1000,
+        }
+
     @cached_property
     def http_url(self) -> str:
         """Get HTTP URL for ClickHouse UI"""
@@ -93,7 +131,7 @@ class ClickHouseSettings(BaseSettings):
         return f"{schema}{self.host}:{self.port}"
 
 
-@lru_cache
+@cache
 def get_clickhouse_settings() -> ClickHouseSettings:
     """Prepares ClickHouse settings from environment variables"""
     return prepare_settings(ClickHouseSettings)
@@ -1,5 +1,5 @@
 import logging
-from functools import lru_cache
+from functools import cache, cached_property
 from typing import Annotated, TypedDict, Any
 
 from pydantic import StringConstraints
@@ -46,7 +46,7 @@ class LogSettings(BaseSettings):
     format: str = "[%(asctime)s] %(levelname)s [%(filename)s:%(lineno)s] %(message)s"
     datefmt: str = "%d.%m.%Y %H:%M:%S"
 
-    @property
+    @cached_property
     def dict_config(self) -> LogDictConfig:
         filters: list[logging.Filter] = []
         if self.skip_static_access:
@@ -80,13 +80,13 @@ class LogSettings(BaseSettings):
             },
         }
 
-    @property
+    @cached_property
     def dict_config_any(self) -> dict[str, Any]:
         """Just simple workaround for type checking in logging config"""
         return dict(self.dict_config)
 
 
-@lru_cache
+@cache
 def get_log_settings() -> LogSettings:
     """Prepares logging settings from environment variables"""
     return prepare_settings(LogSettings)
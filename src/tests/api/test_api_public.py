@@ -3,9 +3,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from starlette.testclient import TestClient
-from starlette.background import BackgroundTasks
 
+from src.constants import CACHE_TTL_ACTIVE_RELEASES_PAGE
 from src.db.clickhouse import ReleasesAnalyticsSchema
+from src.models import PaginatedResponse, ReleasePublicResponse
 
 
 def make_latest_cache_payload(version: str = "2026.3.4") -> dict[str, Any]:
@@ -26,7 +27,7 @@ def make_latest_cache_payload(version: str = "2026.3.4") -> dict[str, Any]:
 
 @pytest.fixture(autouse=True)
 def mock_log_analytics() -> Generator[MagicMock, None, None]:
-    with patch("src.services.analytics.AnalyticsService.log_request_async") as mock_log:
+    with patch("src.services.analytics.AnalyticsWriter.enqueue") as mock_log:
         yield mock_log
 
 
@@ -126,11 +127,7 @@ class TestPublicReleasesAPI:
         # Verify call arguments
         call_args = mock_log_analytics.call_args
         assert call_args is not None
-        kwargs: dict[str, Any] = call_args.kwargs  # type:ignore
-        background_tasks = kwargs.pop("background_tasks")
-        assert isinstance(background_tasks, BackgroundTasks)
-
-        request: ReleasesAnalyticsSchema = kwargs.pop("request")
+        request: ReleasesAnalyticsSchema = call_args.args[0]
         assert isinstance(request, ReleasesAnalyticsSchema)
 
         assert request.client_version == "1.0.0"
@@ -159,9 +156,7 @@ class TestPublicReleasesAPI:
         # Verify call arguments
         call_args = mock_log_analytics.call_args
         assert call_args is not None
-        kwargs: dict[str, Any] = call_args.kwargs  # type:ignore
-
-        request: ReleasesAnalyticsSchema = kwargs.pop("request")
+        request: ReleasesAnalyticsSchema = call_args.args[0]
         assert isinstance(request, ReleasesAnalyticsSchema)
 
         assert request.client_version is None
@@ -182,6 +177,25 @@ class TestPublicReleasesAPI:
         assert response.json() == {"version": "2026.3.4"}
         assert response.headers["content-type"] == "application/json"
 
+    def test_get_active_releases_from_cached_page_object(
+        self,
+        mock_release_cache: MagicMock,
+        mock_cached_releases: MagicMock,
+        client: TestClient,
+    ) -> None:
+        """Test in-memory cached page object is returned without DB access"""
+        payload = make_latest_cache_payload("2026.3.4") | {"limit": 10}
+        mock_release_cache.get.return_value = PaginatedResponse[
+            ReleasePublicResponse
+        ].model_validate(payload)
+
+        response = client.get("/public/releases?offset=0&limit=10")
+
+        assert response.status_code == 200
+        assert response.json()["items"][0]["version"] == "2026.3.4"
+        mock_cached_releases.assert_not_called()
+        mock_release_cache.set.assert_not_awaited()
+
     def test_get_latest_version_plain(
         self,
         mock_release_cache: MagicMock,
@@ -242,9 +256,10 @@ class TestPublicReleasesAPI:
         mock_release_cache.set.assert_awaited_once()
         cache_key, cache_payload = mock_release_cache.set.await_args.args
         assert cache_key == "active_releases_page_0_1"
-        assert cache_payload["items"][0]["version"] == "2025.12.100"
-        assert cache_payload["offset"] == 0
-        assert cache_payload["limit"] == 1
+        assert cache_payload.items[0].version == "2025.12.100"
+        assert cache_payload.offset == 0
+        assert cache_payload.limit == 1
+        assert mock_release_cache.set.await_args.kwargs == {"ttl": CACHE_TTL_ACTIVE_RELEASES_PAGE}
 
     def test_get_latest_version_falls_back_to_database_on_invalid_cache(
         self,
@@ -1,7 +1,13 @@
 from datetime import datetime
+from unittest.mock import patch
 
+import pytest
 from starlette.testclient import TestClient
 
+from src.exceptions import BaseApplicationError
+from src.main import ReleaseAgentAPP
+from src.tests.mocks import MockAPIToken
+
 
 class TestSystemAPI:
     def test_health_check(self, client: TestClient) -> None:
@@ -10,3 +16,52 @@ class TestSystemAPI:
         data = response.json()
         assert data["status"] == "healthy"
         assert isinstance(datetime.fromisoformat(data["timestamp"]), datetime)
+
+    def test_unexpected_error__unified_response(
+        self,
+        test_app: ReleaseAgentAPP,
+        mock_db_api_token__active: MockAPIToken,
+        auth_test_headers: dict[str, str],
+    ) -> None:
+        with (
+            patch("src.modules.api.system.HealthCheck", side_effect=RuntimeError("boom")),
+            # the error is served by ErrorHandlingMiddleware and is not re-raised
+            TestClient(test_app, headers=auth_test_headers) as client,
+        ):
+            response = client.get("/api/system/health/")
+
+        assert response.status_code == 500
+        assert response.json() == {
+            "error": "Internal server error",
+            "detail": "An internal error has been detected. We apologize for the inconvenience.",
+        }
+
+    def test_unknown_route__unified_response(self, client: TestClient) -> None:
+        response = client.get("/api/unknown/")
+
+        assert response.status_code == 404
+        assert response.json() == {
+            "error": "Some http-related error: Not Found",
+            "detail": "404: Not Found",
+        }
+
+    @pytest.mark.parametrize("path", ["/unknown/", "/js/unknown.js"])
+    def test_unknown_route__non_api__default_response(self, client: TestClient, path: str) -> None:
+        response = client.get(path)
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Not Found"}
+
+    def test_admin_error__not_unified(self, test_app: ReleaseAgentAPP) -> None:
+        with (
+            patch(
+                "src.modules.admin.auth.AdminAuth.authenticate",
+                side_effect=BaseApplicationError("boom"),
+            ),
+            TestClient(test_app, raise_server_exceptions=False) as client,
+        ):
+            response = client.get(f"{test_app.settings.admin.base_url}/")
+
+        assert response.status_code == 500
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.text == "Internal Server Error"
@@ -1,13 +1,48 @@
 import datetime
+from types import SimpleNamespace
 import pytest
 from pydantic import SecretStr
-from unittest.mock import MagicMock
 from starlette.exceptions import HTTPException
 
 from src.tests.mocks import MockAPIToken
 from src.utils import utcnow
 from src.settings import AppSettings
-from src.modules.auth.tokens import make_api_token, decode_api_token, hash_token, verify_api_token
+from src.modules.auth.tokens import (
+    GeneratedToken,
+    make_api_token,
+    decode_api_token,
+    hash_token,
+    verify_api_token,
+)
+
+
+def _jwt_exp(dt: datetime.datetime) -> datetime.datetime:
+    """Expiration as it comes back from JWT payload (UTC, whole seconds)"""
+    return dt.replace(tzinfo=datetime.UTC, microsecond=0)
+
+
+@pytest.fixture(scope="session")
+def settings_by_algorithm() -> dict[str, AppSettings]:
+    return {
+        jwt_algorithm: AppSettings(
+            app_secret_key=SecretStr("test-secret-key"),
+            jwt_algorithm=jwt_algorithm,
+        )
+        for jwt_algorithm in ("HS256", "HS512")
+    }
+
+
+@pytest.fixture(scope="session")
+def special_settings() -> AppSettings:
+    return AppSettings(
+        app_secret_key=SecretStr("test-secret-key-with-special-chars!@#$%^&*()"),
+        jwt_algorithm="HS256",
+    )
+
+
+@pytest.fixture(scope="session")
+def generated_tokens_batch(app_settings_test: AppSettings) -> list[GeneratedToken]:
+    return [make_api_token(expires_at=None, settings=app_settings_test) for _ in range(10)]
 
 
 class TestAuthIntegration:
@@ -25,21 +60,15 @@ class TestAuthIntegration:
 
         assert decoded.sub is not None
         assert decoded.exp is not None
-        assert decoded.exp == expires_at.replace(tzinfo=datetime.timezone.utc, microsecond=0)
+        assert decoded.exp == _jwt_exp(expires_at)
 
         # Step 3: Verify token hash
         expected_hash = hash_token(decoded.sub)
         assert generated.hashed_value == expected_hash
 
-    def test_token_format_consistency(self, app_settings_test: AppSettings) -> None:
-        tokens = []
-
-        for _ in range(5):
-            generated = make_api_token(expires_at=None, settings=app_settings_test)
-            tokens.append(generated.value)
-
+    def test_token_format_consistency(self, generated_tokens_batch: list[GeneratedToken]) -> None:
         # All tokens should have the same format characteristics
-        for token in tokens:
+        for token in (generated.value for generated in generated_tokens_batch):
             # No dots (no header)
             assert "." not in token
             # Last 3 characters should be numeric (length prefix)
@@ -48,15 +77,10 @@ class TestAuthIntegration:
             # Token should be longer than just the length prefix
             assert len(token) > 3
 
-    def test_token_uniqueness(self, app_settings_test: AppSettings) -> None:
-        tokens = set()
-
-        for _ in range(10):
-            generated = make_api_token(expires_at=None, settings=app_settings_test)
-            tokens.add(generated.value)
-
+    def test_token_uniqueness(self, generated_tokens_batch: list[GeneratedToken]) -> None:
         # All tokens should be unique
-        assert len(tokens) == 10
+        tokens = {generated.value for generated in generated_tokens_batch}
+        assert len(tokens) == len(generated_tokens_batch)
 
     def test_token_expiration_handling(self, app_settings_test: AppSettings) -> None:
         past_time = utcnow() - datetime.timedelta(hours=1)
@@ -68,7 +92,7 @@ class TestAuthIntegration:
     @pytest.mark.asyncio
     async def test_auth_dependency_integration(
         self,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         app_settings_test: AppSettings,
         mock_db_api_token__active: MockAPIToken,
     ) -> None:
@@ -96,7 +120,7 @@ class TestAuthIntegration:
         exp = utcnow() + datetime.timedelta(**expires_at)
         token = make_api_token(expires_at=exp, settings=app_settings_test)
         decoded = decode_api_token(token.value, app_settings_test)
-        assert decoded.exp == exp.replace(tzinfo=datetime.UTC, microsecond=0)
+        assert decoded.exp == _jwt_exp(exp)
 
     def test_token_identifier_format(self, app_settings_test: AppSettings) -> None:
         generated = make_api_token(expires_at=None, settings=app_settings_test)
@@ -119,16 +143,7 @@ class TestAuthIntegration:
         # All hashes should be identical
         assert hash1 == hash2 == hash3 == generated.hashed_value
 
-    def test_token_with_special_characters_in_settings(
-        self, app_settings_test: AppSettings
-    ) -> None:
-        special_settings = AppSettings(
-            admin_username="test-username",
-            admin_password=SecretStr("test-password"),
-            app_secret_key=SecretStr("test-secret-key-with-special-chars!@#$%^&*()"),
-            jwt_algorithm="HS256",
-        )
-
+    def test_token_with_special_characters_in_settings(self, special_settings: AppSettings) -> None:
         generated = make_api_token(expires_at=None, settings=special_settings)
         decoded = decode_api_token(generated.value, special_settings)
 
@@ -137,36 +152,34 @@ class TestAuthIntegration:
 
     @pytest.mark.parametrize("jwt_algorithm", ("HS256", "HS512"))
     def test_token_with_different_algorithms(
-        self, app_settings_test: AppSettings, jwt_algorithm: str
+        self,
+        settings_by_algorithm: dict[str, AppSettings],
+        jwt_algorithm: str,
     ) -> None:
-        settings = AppSettings(
-            admin_username="test-username",
-            admin_password=SecretStr("test-password"),
-            app_secret_key=SecretStr("test-secret-key"),
-            jwt_algorithm=jwt_algorithm,
-        )
+        settings = settings_by_algorithm[jwt_algorithm]
         token = make_api_token(expires_at=None, settings=settings)
         decoded = decode_api_token(token.value, settings)
 
         assert decoded.sub is not None
 
     def test_token_edge_cases(self, app_settings_test: AppSettings) -> None:
-        short_exp = utcnow() + datetime.timedelta(seconds=1)
+        now = utcnow()
+        short_exp = now + datetime.timedelta(seconds=1)
         token_short = make_api_token(expires_at=short_exp, settings=app_settings_test)
 
         decoded_short = decode_api_token(token_short.value, app_settings_test)
-        assert decoded_short.exp == short_exp.replace(tzinfo=datetime.UTC, microsecond=0)
+        assert decoded_short.exp == _jwt_exp(short_exp)
 
-        long_exp = utcnow() + datetime.timedelta(days=365)
+        long_exp = now + datetime.timedelta(days=365)
         token_long = make_api_token(expires_at=long_exp, settings=app_settings_test)
 
         decoded_long = decode_api_token(token_long.value, app_settings_test)
-        assert decoded_long.exp == long_exp.replace(tzinfo=datetime.UTC, microsecond=0)
+        assert decoded_long.exp == _jwt_exp(long_exp)
 
     @pytest.mark.asyncio
     async def test_auth_dependency_error_handling(
         self,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         app_settings_test: AppSettings,
     ) -> None:
         with pytest.raises(HTTPException, match="Invalid token signature"):
@@ -180,15 +193,13 @@ class TestAuthIntegration:
                 mock_request, app_settings_test, auth_token=f"Bearer {expired_token.value}"
             )
 
-    def test_token_serialization_consistency(self, app_settings_test: AppSettings) -> None:
-        tokens = []
-
-        for _ in range(5):
-            generated = make_api_token(expires_at=None, settings=app_settings_test)
-            tokens.append(generated.value)
-
-        for token in tokens:
-            decoded = decode_api_token(token, app_settings_test)
+    def test_token_serialization_consistency(
+        self,
+        app_settings_test: AppSettings,
+        generated_tokens_batch: list[GeneratedToken],
+    ) -> None:
+        for generated in generated_tokens_batch:
+            decoded = decode_api_token(generated.value, app_settings_test)
             assert decoded.sub is not None
             assert decoded.exp is not None
 
@@ -1,4 +1,5 @@
 import os
+from types import SimpleNamespace
 from typing import Any, Generator, AsyncGenerator
 from unittest.mock import MagicMock, patch, AsyncMock
 
@@ -6,10 +7,10 @@ import pytest
 from starlette.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.db import initialize_database
 from src.main import make_app, ReleaseAgentAPP
 from src.modules.auth.tokens import make_api_token
-from src.settings import AppSettings, get_app_settings
+from src.services.cache import InMemoryCache
+from src.settings import AppSettings
 from pydantic import SecretStr
 
 from src.tests.mocks import MockAPIToken, MockUser, MockTestResponse, MockHTTPxClient
@@ -29,11 +30,13 @@ def mock_user() -> MockUser:
     return MockUser(id=1, is_active=True, username="test-user")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app_settings_test() -> AppSettings:
-    return AppSettings(
-        app_secret_key=SecretStr("example-UStLb8mds9K"),
-    )
+    """Shared between tests: use monkeypatch for changing any value"""
+    with patch.dict(os.environ, MINIMAL_ENV_VARS):
+        return AppSettings(
+            app_secret_key=SecretStr("example-UStLb8mds9K"),
+        )
 
 
 @pytest.fixture(autouse=True)
@@ -42,6 +45,13 @@ def minimal_env_vars() -> Generator[None, Any, None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+async def clear_memory_cache() -> AsyncGenerator[None, Any]:
+    """Avoid leaking in-memory cached values (like verified tokens' states) between tests"""
+    yield
+    await InMemoryCache().invalidate(pattern="*")
+
+
 @pytest.fixture
 def mock_clickhouse() -> Generator[None, None, None]:
     """Mock ClickHouse initialization to avoid connection errors in tests"""
@@ -52,28 +62,37 @@ def mock_clickhouse() -> Generator[None, None, None]:
         yield
 
 
+@pytest.fixture(scope="session")
+def session_app(app_settings_test: AppSettings) -> ReleaseAgentAPP:
+    """Application is built once: make_app() is the most expensive part of tests' setup"""
+    return make_app(settings=app_settings_test)
+
+
 @pytest.fixture(autouse=True)
-async def test_app(
-    app_settings_test: AppSettings,
+def test_app(
+    session_app: ReleaseAgentAPP,
     mock_clickhouse: None,
-) -> AsyncGenerator[ReleaseAgentAPP, Any]:
-    test_app = make_app(settings=app_settings_test)
-    test_app.dependency_overrides[get_app_settings] = lambda: test_app.settings
-    await initialize_database()
-    yield test_app
-    test_app.dependency_overrides.clear()
+) -> Generator[ReleaseAgentAPP, Any, None]:
+    routes = list(session_app.router.routes)
+    yield session_app
+    # drop routes mounted by the test (admin app is mounted on each lifespan's startup)
+    session_app.router.routes[:] = routes
+    session_app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_test_token(app_settings_test: AppSettings) -> str:
     return make_api_token(expires_at=None, settings=app_settings_test).value
 
 
+@pytest.fixture(scope="session")
+def auth_test_headers(auth_test_token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {auth_test_token}"}
+
+
 @pytest.fixture
-def mock_request() -> MagicMock:
-    request = MagicMock()
-    request.method = "GET"
-    return request
+def mock_request() -> SimpleNamespace:
+    return SimpleNamespace(method="GET")
 
 
 @pytest.fixture
@@ -87,12 +106,15 @@ def mock_db_session() -> AsyncMock:
 @pytest.fixture
 def mock_db_session_factory(mock_db_session: AsyncMock) -> Generator[MagicMock, None]:
     _session_factory = MagicMock(spec=async_sessionmaker, return_value=mock_db_session)
+    _session_factory.class_ = AsyncSession
     with patch("src.db.session.get_session_factory", return_value=_session_factory) as _mock:
         yield _mock
 
 
 @pytest.fixture
-def mock_db_api_token__active() -> Generator[MockAPIToken, Any, None]:
+def mock_db_api_token__active(
+    mock_db_session_factory: MagicMock,
+) -> Generator[MockAPIToken, Any, None]:
     with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
         mock_token = MockAPIToken(is_active=True, user=MockUser(id=1, is_active=True))
         mock_get_by_token.return_value = mock_token
@@ -103,12 +125,9 @@ def mock_db_api_token__active() -> Generator[MockAPIToken, Any, None]:
 def client(
     test_app: ReleaseAgentAPP,
     mock_db_api_token__active: MockAPIToken,
-    auth_test_token: str,
+    auth_test_headers: dict[str, str],
 ) -> Generator[TestClient, Any, None]:
-    headers = {
-        "Authorization": f"Bearer {auth_test_token}",
-    }
-    with TestClient(test_app, headers=headers) as client:
+    with TestClient(test_app, headers=auth_test_headers) as client:
         yield client
 
 
@@ -0,0 +1,196 @@
+import asyncio
+import datetime
+from typing import Any, Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.db.clickhouse import ReleasesAnalyticsSchema
+from src.services.analytics import AnalyticsService, AnalyticsWriter, get_analytics_writer
+from src.utils import utcnow
+
+
+def make_analytics_row(client_version: str = "1.0.0") -> ReleasesAnalyticsSchema:
+    return ReleasesAnalyticsSchema(
+        timestamp=utcnow(skip_tz=False),
+        client_version=client_version,
+        client_install_id=None,
+        client_is_corporate=None,
+        client_is_internal=None,
+        client_ip_address=None,
+        client_user_agent=None,
+        client_ref_url=None,
+        response_latest_version="2025.12.100",
+        response_status=200,
+        response_time_ms=1.5,
+        response_from_cache=False,
+    )
+
+
+class TestAnalyticsService:
+
+    async def test_log_batch__single_insert(self) -> None:
+        settings = MagicMock(
+            analytics_table_name="test_analytics",
+            database="test",
+            insert_settings={"async_insert": 1},
+        )
+        service = AnalyticsService(clickhouse_settings=settings)
+        rows = [make_analytics_row("1.0.0"), make_analytics_row("1.0.1")]
+        mock_client = AsyncMock()
+
+        with patch("src.services.analytics.get_clickhouse_client", return_value=mock_client):
+            await service.log_batch(rows)
+
+        mock_client.insert.assert_awaited_once()
+        insert_kwargs = mock_client.insert.await_args.kwargs
+        assert insert_kwargs["table"] == "test_analytics"
+        assert insert_kwargs["column_names"] == tuple(ReleasesAnalyticsSchema.model_fields)
+        assert insert_kwargs["settings"] == {"async_insert": 1}
+        assert insert_kwargs["column_oriented"] is True
+        assert insert_kwargs["data"][1] == ["1.0.0", "1.0.1"]
+
+    async def test_log_batch__sorted_by_timestamp(self) -> None:
+        service = AnalyticsService(clickhouse_settings=MagicMock(insert_settings={}))
+        rows = [make_analytics_row("1.0.0"), make_analytics_row("1.0.1")]
+        rows[0].timestamp += datetime.timedelta(seconds=1)
+        mock_client = AsyncMock()
+
+        with patch("src.services.analytics.get_clickhouse_client", return_value=mock_client):
+            await service.log_batch(rows)
+
+        assert mock_client.insert.await_args.kwargs["data"][1] == ["1.0.1", "1.0.0"]
+
+
+class TestAnalyticsWriter:
+
+    @pytest.fixture
+    def mock_service(self) -> MagicMock:
+        service = MagicMock(spec=AnalyticsService)
+        service.log_batch = AsyncMock()
+        return service
+
+    async def test_flush_by_batch_size(self, mock_service: MagicMock) -> None:
+        writer = AnalyticsWriter(mock_service, batch_size=3, flush_interval=10)
+        writer.start()
+        rows = [make_analytics_row(f"1.0.{i}") for i in range(3)]
+        for row in rows:
+            writer.enqueue(row)
+
+        await asyncio.sleep(0.01)
+
+        mock_service.log_batch.assert_awaited_once_with(rows)
+        await writer.stop()
+
+    async def test_flush_by_interval(self, mock_service: MagicMock) -> None:
+        writer = AnalyticsWriter(mock_service, batch_size=100, flush_interval=0.01)
+        writer.start()
+        row = make_analytics_row()
+        writer.enqueue(row)
+
+        await asyncio.sleep(0.05)
+
+        mock_service.log_batch.assert_awaited_once_with([row])
+        await writer.stop()
+
+    async def test_stop_flushes_buffered_rows(self, mock_service: MagicMock) -> None:
+        writer = AnalyticsWriter(mock_service, batch_size=100, flush_interval=10)
+        writer.start()
+        rows = [make_analytics_row(f"1.0.{i}") for i in range(5)]
+        for row in rows:
+            writer.enqueue(row)
+
+        await writer.stop()
+
+        mock_service.log_batch.assert_awaited_once_with(rows)
+
+    async def test_stop_during_slow_flush__all_rows_written(self, mock_service: MagicMock) -> None:
+        written: list[ReleasesAnalyticsSchema] = []
+
+        async def slow_log_batch(batch: list[ReleasesAnalyticsSchema]) -> None:
+            await asyncio.sleep(0.05)
+            written.extend(batch)
+
+        mock_service.log_batch.side_effect = slow_log_batch
+        writer = AnalyticsWriter(mock_service, batch_size=2, flush_interval=10)
+        writer.start()
+        rows = [make_analytics_row(f"1.0.{i}") for i in range(5)]
+        for row in rows[:2]:
+            writer.enqueue(row)
+
+        await asyncio.sleep(0.01)  # the first batch is being written now
+        for row in rows[2:]:
+            writer.enqueue(row)
+
+        await writer.stop()
+
+        assert written == rows
+        assert writer.stats.failed_rows == 0
+
+    async def test_overflow_drops_oldest_row(self, mock_service: MagicMock) -> None:
+        writer = AnalyticsWriter(mock_service, batch_size=100, flush_interval=10, max_queue_size=2)
+        writer.start()
+        rows = [make_analytics_row(f"1.0.{i}") for i in range(3)]
+        for row in rows:
+            writer.enqueue(row)
+
+        await writer.stop()
+
+        mock_service.log_batch.assert_awaited_once_with(rows[1:])
+        assert writer.stats.dropped_rows == 1
+
+    async def test_failed_flush_keeps_writer_running(self, mock_service: MagicMock) -> None:
+        mock_service.log_batch.side_effect = [RuntimeError("CH is down"), None]
+        writer = AnalyticsWriter(mock_service, batch_size=1, flush_interval=10)
+        writer.start()
+
+        writer.enqueue(make_analytics_row("1.0.0"))
+        await asyncio.sleep(0.01)
+        writer.enqueue(make_analytics_row("1.0.1"))
+        await asyncio.sleep(0.01)
+
+        assert mock_service.log_batch.await_count == 2
+        assert writer.stats.failed_rows == 1
+        assert writer.stats.last_flush_rows == 1
+        await writer.stop()
+
+    async def test_stats(self, mock_service: MagicMock) -> None:
+        writer = AnalyticsWriter(mock_service, batch_size=100, flush_interval=10)
+        writer.start()
+        for i in range(3):
+            writer.enqueue(make_analytics_row(f"1.0.{i}"))
+
+        assert writer.stats.queue_size == 3
+        await writer.stop()
+
+        stats = writer.stats
+        assert stats.queue_size == 0
+        assert stats.dropped_rows == 0
+        assert stats.last_flush_rows == 3
+        assert stats.last_flush_latency_ms >= 0
+
+    def test_enqueue_without_start__skipped(self, mock_service: MagicMock) -> None:
+        writer = AnalyticsWriter(mock_service, batch_size=100, flush_interval=10)
+        writer.enqueue(make_analytics_row())
+        mock_service.log_batch.assert_not_called()
+
+
+class TestGetAnalyticsWriter:
+
+    @pytest.fixture
+    def clear_writer_cache(self) -> Generator[None, Any, None]:
+        get_analytics_writer.cache_clear()
+        yield
+        get_analytics_writer.cache_clear()
+
+    def test_created_on_first_call(self, clear_writer_cache: None) -> None:
+        settings = MagicMock(insert_batch_size=7, insert_flush_interval=0.1)
+        with patch(
+            "src.services.analytics.get_clickhouse_settings", return_value=settings
+        ) as mock_get_settings:
+            writer = get_analytics_writer()
+            assert get_analytics_writer() is writer
+
+        mock_get_settings.assert_called_once()
+        assert writer._batch_size == 7
+        assert writer._flush_interval == 0.1
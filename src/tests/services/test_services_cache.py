@@ -1,8 +1,24 @@
-import time
+import asyncio
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.services.cache import InMemoryCache
+from src.services.cache import InMemoryCache, RedisCache, SingleFlight, get_cache
+from src.settings import get_app_settings
+
+
+class FakeClock:
+    """Replaces cache's monotonic clock: time is moved forward explicitly (no sleeping)"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def tick(self, seconds: float) -> None:
+        self.now += seconds
 
 
 class TestCache:
@@ -11,6 +27,12 @@ class TestCache:
     def cache(self) -> InMemoryCache:
         return InMemoryCache()
 
+    @pytest.fixture
+    def clock(self, cache: InMemoryCache, monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+        clock = FakeClock()
+        monkeypatch.setattr(cache, "_now", clock)
+        return clock
+
     @pytest.mark.asyncio
     async def test_get_set(self, cache: InMemoryCache) -> None:
         # Test setting and getting value
@@ -23,18 +45,39 @@ class TestCache:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_ttl_expiration(self, cache: InMemoryCache, monkeypatch) -> None:  # type: ignore
-        old_ttl = cache._ttl
-        cache._ttl = 0.1
+    async def test_ttl_expiration(
+        self,
+        cache: InMemoryCache,
+        clock: FakeClock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(cache, "_ttl", 0.1)
         await cache.set("test", "value")
         result = await cache.get("test")
         assert result == "value"
 
         # Verify value is gone
-        time.sleep(0.2)
+        clock.tick(0.2)
         result = await cache.get("test")
         assert result is None
-        cache._ttl = old_ttl
+
+    async def test_ttl_per_key(self, cache: InMemoryCache, clock: FakeClock) -> None:
+        await cache.set("short", "value", ttl=0.1)  # type: ignore[arg-type]
+        await cache.set("long", "value")
+
+        clock.tick(0.2)
+        assert await cache.get("short") is None
+        assert await cache.get("long") == "value"
+
+    async def test_expired_keys_swept_on_get(self, cache: InMemoryCache, clock: FakeClock) -> None:
+        await cache.set("short", "value", ttl=0.1)  # type: ignore[arg-type]
+        await cache.set("long", "value")
+
+        clock.tick(0.2)
+        # read-only traffic drops expired keys too (they don't count toward max_size)
+        assert await cache.get("long") == "value"
+        assert list(cache._data) == ["long"]
+        await cache.invalidate("long")
 
     @pytest.mark.asyncio
     async def test_invalidate(self, cache: InMemoryCache) -> None:
@@ -55,3 +98,188 @@ class TestCache:
         result2 = await cache.get("key2")
         assert result1 is None
         assert result2 is None
+
+    async def test_expired_keys_swept_on_set(self, cache: InMemoryCache, clock: FakeClock) -> None:
+        await cache.set("short", "value", ttl=0.1)  # type: ignore[arg-type]
+        await cache.set("overwritten", "value", ttl=0.1)  # type: ignore[arg-type]
+        await cache.set("overwritten", "new-value")
+
+        clock.tick(0.2)
+        await cache.set("other", "value")
+
+        assert "short" not in cache._data
+        assert await cache.get("overwritten") == "new-value"
+        await cache.invalidate(pattern="*")
+
+    @pytest.mark.parametrize(
+        "pattern, expected_keys",
+        (
+            ("active_releases_page_*", {"active_releases", "api_token__hash"}),
+            ("api_token__*", {"active_releases", "active_releases_page_0_10"}),
+            ("act*", {"api_token__hash"}),
+        ),
+    )
+    async def test_invalidate_pattern(
+        self, cache: InMemoryCache, pattern: str, expected_keys: set[str]
+    ) -> None:
+        for key in ("active_releases", "active_releases_page_0_10", "api_token__hash"):
+            await cache.set(key, "value")
+
+        await cache.invalidate(pattern=pattern)
+
+        assert set(cache._data) == expected_keys
+        assert set().union(*cache._prefix_buckets.values()) == expected_keys
+        await cache.invalidate(pattern="*")
+
+    async def test_lru_eviction(self, cache: InMemoryCache, monkeypatch) -> None:  # type: ignore
+        monkeypatch.setattr(cache, "_max_size", 2)
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        # key1 becomes the most recently used one
+        assert await cache.get("key1") == "value1"
+
+        await cache.set("key3", "value3")
+
+        assert await cache.get("key2") is None
+        assert await cache.get("key1") == "value1"
+        assert await cache.get("key3") == "value3"
+        await cache.invalidate(pattern="*")
+
+
+class TestRedisCache:
+
+    @pytest.fixture
+    def mock_redis_client(self) -> MagicMock:
+        keys = [f"active_releases_page_{i}_10" for i in range(3)]
+
+        async def scan_iter(**kwargs: Any) -> AsyncIterator[str]:
+            for key in keys:
+                yield key
+
+        pipeline = MagicMock()
+        pipeline.__aenter__ = AsyncMock(return_value=pipeline)
+        pipeline.__aexit__ = AsyncMock(return_value=None)
+        pipeline.execute = AsyncMock(return_value=[1])
+
+        client = MagicMock()
+        client.scan_iter = MagicMock(side_effect=scan_iter)
+        client.unlink = AsyncMock(side_effect=lambda *keys: len(keys))
+        client.pipeline = MagicMock(return_value=pipeline)
+        return client
+
+    @pytest.fixture
+    def cache(self, mock_redis_client: MagicMock, monkeypatch) -> RedisCache:  # type: ignore
+        cache = RedisCache()
+        monkeypatch.setattr(cache, "_client", mock_redis_client)
+        return cache
+
+    async def test_invalidate_pattern__scan_and_pipelined_unlink(
+        self, cache: RedisCache, mock_redis_client: MagicMock, monkeypatch  # type: ignore
+    ) -> None:
+        monkeypatch.setattr("src.services.cache.REDIS_SCAN_COUNT", 2)
+
+        await cache.invalidate(pattern="active_releases_page_*")
+
+        mock_redis_client.scan_iter.assert_called_once_with(match="active_releases_page_*", count=2)
+        pipeline = mock_redis_client.pipeline.return_value
+        mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+        assert [call.args for call in pipeline.unlink.call_args_list] == [
+            ("active_releases_page_0_10",),
+            ("active_releases_page_1_10",),
+            ("active_releases_page_2_10",),
+        ]
+        # buffered UNLINKs are flushed every REDIS_SCAN_COUNT keys (and the remainder at the end)
+        assert pipeline.execute.await_count == 2
+        mock_redis_client.keys.assert_not_called()
+
+    async def test_invalidate_key(self, cache: RedisCache, mock_redis_client: MagicMock) -> None:
+        await cache.invalidate("some-key")
+        mock_redis_client.unlink.assert_awaited_once_with("some-key")
+
+    async def test_client_is_resolved_per_operation(self, monkeypatch) -> None:  # type: ignore
+        cache = RedisCache()
+        monkeypatch.setattr(cache, "_client", None)
+        clients = [AsyncMock(), AsyncMock()]
+
+        for client in clients:
+            with patch("src.services.cache.get_redis_client", return_value=client):
+                await cache.invalidate("some-key")
+
+        for client in clients:
+            client.unlink.assert_awaited_once_with("some-key")
+
+    def test_get_cache__redis_enabled(self, monkeypatch) -> None:  # type: ignore
+        monkeypatch.setattr(get_app_settings().flags, "use_redis", True)
+        assert get_cache() is RedisCache()
+
+
+class TestSingleFlight:
+
+    async def test_concurrent_calls_share_single_load(self) -> None:
+        flight: SingleFlight[str] = SingleFlight()
+        calls = 0
+
+        async def loader() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("key", loader) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert calls == 1
+
+    async def test_error_is_propagated_to_waiters(self) -> None:
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def loader() -> str:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", loader), flight.do("key", loader), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        # next call starts a new load
+        with pytest.raises(RuntimeError):
+            await flight.do("key", loader)
+
+    async def test_cancelled_leader__waiter_loads_value(self) -> None:
+        flight: SingleFlight[str] = SingleFlight()
+        calls = 0
+
+        async def loader() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(flight.do("key", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("key", loader))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await waiter == "value"
+        assert leader.cancelled()
+        assert calls == 2
+
+    async def test_cancelled_waiter__shared_load_continues(self) -> None:
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def loader() -> str:
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(flight.do("key", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("key", loader))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+
+        assert await leader == "value"
+        assert waiter.cancelled()
@@ -0,0 +1,23 @@
+from unittest.mock import AsyncMock, patch
+
+from src.db.repositories import ActiveReleasesStat
+from src.services.cache import invalidate_release_cache
+from src.services.counters import AdminCounter, DashboardCounts
+
+
+class TestAdminCounter:
+
+    async def test_get_stat__cached_until_releases_invalidated(self) -> None:
+        mock_session = AsyncMock()
+        with patch(
+            "src.db.repositories.ReleaseRepository.group_by_active",
+            return_value=ActiveReleasesStat(active=3, inactive=2),
+        ) as mock_group_by_active:
+            expected = DashboardCounts(total_releases=5, active_releases=3, inactive_releases=2)
+            assert await AdminCounter.get_stat(session=mock_session) == expected
+            assert await AdminCounter.get_stat(session=mock_session) == expected
+            assert mock_group_by_active.await_count == 1
+
+            await invalidate_release_cache()
+            assert await AdminCounter.get_stat(session=mock_session) == expected
+            assert mock_group_by_active.await_count == 2
@@ -0,0 +1,154 @@
+import json
+from typing import AsyncGenerator, AsyncIterator, Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+
+from src.services.proxy import proxy, get_proxy_client, close_proxy_client
+
+
+def make_request(path: str = "play", query: bytes = b"user=test") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": f"/admin/analytics-proxy/{path}",
+            "query_string": query,
+            "headers": [(b"host", b"localhost"), (b"accept", b"*/*")],
+            "path_params": {"path": path},
+        }
+    )
+
+
+async def stream_body() -> AsyncIterator[bytes]:
+    yield b"\x00\x01"
+
+
+def ch_handler(request: httpx.Request) -> httpx.Response:
+    if request.method == "POST":
+        return httpx.Response(
+            200, text=request.read().decode(), headers={"content-type": "text/plain"}
+        )
+
+    if request.url.path == "/play":
+        return httpx.Response(200, text="<html/>", headers={"content-type": "text/html"})
+
+    if request.url.path == "/headers":
+        return httpx.Response(
+            200,
+            json=dict(request.headers),
+            headers={"content-type": "text/plain", "Keep-Alive": "timeout=5"},
+        )
+
+    if request.url.path == "/redirect":
+        return httpx.Response(302, headers={"location": "http://ch:8123/play"})
+
+    if request.url.path == "/stream":
+        # body isn't read by the transport: the response stays open until it's closed
+        return httpx.Response(200, content=stream_body(), headers={"content-type": "image/png"})
+
+    return httpx.Response(200, content=b"\x00\x01", headers={"content-type": "image/png"})
+
+
+@pytest.fixture
+async def mock_proxy_client() -> AsyncGenerator[httpx.AsyncClient, Any]:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(ch_handler))
+    with patch("src.services.proxy.get_proxy_client", return_value=client):
+        yield client
+
+    await client.aclose()
+
+
+async def call_proxy(path: str) -> Any:
+    return await proxy(
+        make_request(path),
+        proxy_url="http://ch:8123",
+        proxy_host="ch",
+        proxy_port=8123,
+        proxy_path="/admin/analytics-proxy",
+    )
+
+
+class TestProxy:
+
+    async def test_text_response(self, mock_proxy_client: httpx.AsyncClient) -> None:
+        response = await call_proxy("play")
+
+        assert response.status_code == 200
+        assert response.body == b"<html/>"
+
+    async def test_binary_response_streamed(self, mock_proxy_client: httpx.AsyncClient) -> None:
+        response = await call_proxy("logo.png")
+
+        assert isinstance(response, StreamingResponse)
+        assert b"".join([chunk async for chunk in response.body_iterator]) == b"\x00\x01"
+
+    async def test_upstream_response_closed_on_error(
+        self, mock_proxy_client: httpx.AsyncClient
+    ) -> None:
+        send = mock_proxy_client.send
+        responses: list[httpx.Response] = []
+
+        async def tracked_send(*args: Any, **kwargs: Any) -> httpx.Response:
+            responses.append(await send(*args, **kwargs))
+            return responses[-1]
+
+        with (
+            patch.object(mock_proxy_client, "send", side_effect=tracked_send),
+            patch("src.services.proxy.StreamingResponse", side_effect=RuntimeError("boom")),
+        ):
+            response = await call_proxy("stream")
+
+        assert response.status_code == 500
+        assert responses[0].is_closed
+
+    async def test_hop_by_hop_headers_excluded(self, mock_proxy_client: httpx.AsyncClient) -> None:
+        response = await call_proxy("headers")
+
+        sent_headers = json.loads(response.body)
+        assert sent_headers["host"] == "ch:8123"
+        assert sent_headers["accept"] == "*/*"
+        assert "keep-alive" not in response.headers
+
+    async def test_redirect_location_rewritten(self, mock_proxy_client: httpx.AsyncClient) -> None:
+        response = await call_proxy("redirect")
+
+        assert response.status_code == 302
+        assert response.headers["location"] == "/admin/analytics-proxy/play"
+
+    async def test_request_body_streamed(self, mock_proxy_client: httpx.AsyncClient) -> None:
+        chunks = [b"SELECT ", b"1"]
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": chunks.pop(0), "more_body": bool(chunks)}
+
+        request = Request(
+            {
+                "type": "http",
+                "method": "POST",
+                "path": "/admin/analytics-proxy/",
+                "query_string": b"",
+                "headers": [(b"content-length", b"8")],
+                "path_params": {"path": ""},
+            },
+            receive=receive,
+        )
+        response = await proxy(
+            request,
+            proxy_url="http://ch:8123",
+            proxy_host="ch",
+            proxy_port=8123,
+            proxy_path="/admin/analytics-proxy",
+        )
+
+        assert response.body == b"SELECT 1"
+
+    async def test_shared_client(self) -> None:
+        client = get_proxy_client()
+        assert get_proxy_client() is client
+
+        await close_proxy_client()
+        assert client.is_closed
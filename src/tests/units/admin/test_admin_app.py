@@ -1,5 +1,6 @@
+from types import SimpleNamespace
 from typing import Any, Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -7,12 +8,34 @@ from starlette.datastructures import FormData, URL
 from starlette.responses import Response
 
 from src.main import ReleaseAgentAPP
+from src.modules.admin import app as admin_module
 from src.modules.admin.app import AdminApp, ADMIN_VIEWS, make_admin
 from src.modules.admin.views import BaseAPPView, BaseModelView
 from src.services.counters import DashboardCounts
 
 
-@pytest.fixture
+async def _noop_auth(*_: Any, **__: Any) -> bool:
+    return True
+
+
+# sqladmin only needs `.middlewares` (app building) and `.authenticate` (login_required)
+NOOP_AUTH_BACKEND = SimpleNamespace(middlewares=[], authenticate=_noop_auth)
+
+EXPECTED_INDEX_CONTEXT = {
+    "counts": {
+        "active": 5,
+        "inactive": 7,
+        "total": 12,
+    },
+    "links": {
+        "active": "/radm/release/list?active=true",
+        "inactive": "/radm/release/list?inactive=true",
+        "total": "/radm/release/list",
+    },
+}
+
+
+@pytest.fixture(scope="module")
 def mock_session_factory() -> MagicMock:
     session_factory = MagicMock()
     session_factory.class_ = MagicMock()
@@ -20,20 +43,36 @@ def mock_session_factory() -> MagicMock:
     return session_factory
 
 
-@pytest.fixture
-def admin_app(test_app: ReleaseAgentAPP, mock_session_factory: MagicMock) -> AdminApp:
+@pytest.fixture(scope="module")
+def module_admin_app(
+    session_app: ReleaseAgentAPP,
+    mock_session_factory: MagicMock,
+) -> Generator[AdminApp, Any, None]:
+    """Admin app is built once per module (templates' env and views registration are heavy)"""
+    routes = list(session_app.router.routes)
     with patch("src.db.session.get_session_factory", return_value=mock_session_factory):
         with patch("sqladmin.helpers.is_async_session_maker", return_value=True):
-            return AdminApp(
-                test_app,
+            admin_app = AdminApp(
+                session_app,
                 base_url="/admin",
                 title="Test Admin",
                 session_maker=mock_session_factory,
-                authentication_backend=AsyncMock(),
+                authentication_backend=NOOP_AUTH_BACKEND,
             )
 
+    yield admin_app
+    session_app.router.routes[:] = routes
+
 
 @pytest.fixture
+def admin_app(module_admin_app: AdminApp) -> Generator[AdminApp, Any, None]:
+    # tests replace templates and views: restore them for the next test
+    templates, views = module_admin_app.templates, module_admin_app._views
+    yield module_admin_app
+    module_admin_app.templates, module_admin_app._views = templates, views
+
+
+@pytest.fixture(scope="module")
 def mock_form_data() -> FormData:
     return FormData({"field": "value"})
 
@@ -54,7 +93,7 @@ def mock_model_view() -> MagicMock:
 
 @pytest.fixture
 def mock_get_settings() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.admin.app.get_app_settings") as mock_get_settings:
+    with patch.object(admin_module, "get_app_settings") as mock_get_settings:
         mock_settings = MagicMock()
         mock_get_settings.return_value = mock_settings
         yield mock_get_settings
@@ -62,7 +101,7 @@ def mock_get_settings() -> Generator[MagicMock, Any, None]:
 
 @pytest.fixture
 def mock_uow_class() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.admin.app.SASessionUOW") as mock_uow_class:
+    with patch.object(admin_module, "SASessionUOW") as mock_uow_class:
         mock_uow = AsyncMock()
         mock_uow_class.return_value.__aenter__.return_value = mock_uow
         yield mock_uow_class
@@ -70,7 +109,7 @@ def mock_uow_class() -> Generator[MagicMock, Any, None]:
 
 @pytest.fixture
 def mock_counter_class() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.admin.app.AdminCounter") as mock_counter_class:
+    with patch.object(admin_module, "AdminCounter") as mock_counter_class:
         mock_counter = MagicMock()
         mock_counter.get_stat = AsyncMock()
         mock_counter_class.return_value = mock_counter
@@ -85,20 +124,20 @@ def mock_super_get_save_redirect_url() -> Generator[MagicMock, Any, None]:
 
 @pytest.fixture
 def mock_get_error_alert() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.admin.app.get_current_error_alert") as mock_get_error_alert:
+    with patch.object(admin_module, "get_current_error_alert") as mock_get_error_alert:
         mock_get_error_alert.return_value = "error_alert_func"
         yield mock_get_error_alert
 
 
 @pytest.fixture
 def mock_admin_auth_class() -> Generator[MagicMock, Any, None]:
-    with patch("src.modules.admin.app.AdminAuth") as mock_admin_auth_class:
+    with patch.object(admin_module, "AdminAuth") as mock_admin_auth_class:
         mock_admin_auth = MagicMock()
         mock_admin_auth_class.return_value = mock_admin_auth
         yield mock_admin_auth_class
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def mock_is_async_session_maker() -> Generator[MagicMock, Any, None]:
     with patch("sqladmin.helpers.is_async_session_maker", return_value=True) as mock_is_async:
         yield mock_is_async
@@ -110,21 +149,24 @@ class TestAdminAppInitialization:
         test_app: ReleaseAgentAPP,
         mock_session_factory: MagicMock,
     ) -> None:
-        with patch.object(AdminApp, "_init_jinja_templates") as mock_init_jinja:
-            with patch.object(AdminApp, "_register_views") as mock_register_views:
-                admin = AdminApp(
-                    test_app,
-                    base_url="/admin",
-                    title="Test Admin",
-                    session_maker=mock_session_factory,
-                    authentication_backend=MagicMock(),
-                )
+        with patch.multiple(
+            AdminApp,
+            _init_jinja_templates=DEFAULT,
+            _register_views=DEFAULT,
+        ) as mocks:
+            admin = AdminApp(
+                test_app,
+                base_url="/admin",
+                title="Test Admin",
+                session_maker=mock_session_factory,
+                authentication_backend=NOOP_AUTH_BACKEND,
+            )
 
         assert admin.app == test_app
         assert admin.custom_templates_dir == "modules/admin/templates"
         assert isinstance(admin._views, list)
-        mock_init_jinja.assert_called_once()
-        mock_register_views.assert_called_once()
+        mocks["_init_jinja_templates"].assert_called_once()
+        mocks["_register_views"].assert_called_once()
 
     def test_admin_app_views_initialization(self, admin_app: AdminApp) -> None:
         assert isinstance(admin_app._views, list)
@@ -133,13 +175,9 @@ class TestAdminAppInitialization:
 
 @pytest.mark.asyncio
 class TestAdminAppIndex:
-    @pytest.fixture
-    def mock_dashboard_stat(self) -> MagicMock:
-        mock_stat = MagicMock()
-        mock_stat.total_releases = 12
-        mock_stat.active_releases = 5
-        mock_stat.inactive_releases = 7
-        return mock_stat
+    @pytest.fixture(scope="class")
+    def mock_dashboard_stat(self) -> DashboardCounts:
+        return DashboardCounts(total_releases=12, active_releases=5, inactive_releases=7)
 
     @pytest.fixture
     def mock_template_response(self) -> MagicMock:
@@ -148,9 +186,10 @@ class TestAdminAppIndex:
     async def test_index_success(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
+        mock_uow_class: MagicMock,
         mock_counter_class: MagicMock,
-        mock_dashboard_stat: MagicMock,
+        mock_dashboard_stat: DashboardCounts,
         mock_template_response: MagicMock,
     ) -> None:
         mock_counter = mock_counter_class.return_value
@@ -171,26 +210,16 @@ class TestAdminAppIndex:
         assert "context" in template_call_args[1]
 
         context = template_call_args[1]["context"]
-        assert context == {
-            "counts": {
-                "active": 5,
-                "inactive": 7,
-                "total": 12,
-            },
-            "links": {
-                "active": "/radm/release/list?active=true",
-                "inactive": "/radm/release/list?inactive=true",
-                "total": "/radm/release/list",
-            },
-        }
+        assert context == EXPECTED_INDEX_CONTEXT
 
     async def test_index_counter_error(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_get_settings: MagicMock,
+        mock_uow_class: MagicMock,
         mock_counter_class: MagicMock,
-        mock_dashboard_stat: MagicMock,
+        mock_dashboard_stat: DashboardCounts,
         mock_template_response: MagicMock,
     ) -> None:
         mock_counter = mock_counter_class.return_value
@@ -211,9 +240,9 @@ class TestAdminAppIndex:
     async def test_index_database_error(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_get_settings: MagicMock,
-        # mock_uow_class: MagicMock,
+        mock_uow_class: MagicMock,
         mock_counter_class: MagicMock,
     ) -> None:
         mock_counter = mock_counter_class.return_value
@@ -228,11 +257,11 @@ class TestAdminAppCreate:
     async def test_create_get_request(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_create: MagicMock,
     ) -> None:
         mock_request.method = "GET"
-        mock_response = MagicMock(spec=Response)
+        mock_response = SimpleNamespace(headers={})
         mock_create.return_value = mock_response
 
         result = await admin_app.create(mock_request)
@@ -243,13 +272,14 @@ class TestAdminAppCreate:
     async def test_create_post_request_no_custom_post_create(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_model_view: MagicMock,
         mock_create: MagicMock,
         mock_find_model_view: MagicMock,
     ) -> None:
         mock_request.method = "POST"
-        mock_response = MagicMock(spec=Response)
+        mock_request.path_params = {"identity": "release"}
+        mock_response = SimpleNamespace(headers={})
         mock_model_view.custom_post_create = False
 
         mock_create.return_value = mock_response
@@ -273,14 +303,14 @@ class TestAdminAppCreate:
     async def test_create_post_request_with_custom_post_create(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_model_view: MagicMock,
         mock_create: MagicMock,
         mock_find_model_view: MagicMock,
     ) -> None:
         mock_request.method = "POST"
-        mock_response = MagicMock(spec=Response)
-        mock_response.headers = {"location": "123"}
+        mock_request.path_params = {"identity": "release"}
+        mock_response = SimpleNamespace(headers={"location": "123"})
         mock_model_view.custom_post_create = True
         mock_model_view.handle_post_create = AsyncMock(return_value=mock_response)
 
@@ -297,14 +327,14 @@ class TestAdminAppCreate:
     async def test_create_post_request_handle_post_create_error(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_model_view: MagicMock,
         mock_create: MagicMock,
         mock_find_model_view: MagicMock,
     ) -> None:
         mock_request.method = "POST"
-        mock_response = MagicMock(spec=Response)
-        mock_response.headers = {"location": "123"}
+        mock_request.path_params = {"identity": "release"}
+        mock_response = SimpleNamespace(headers={"location": "123"})
         mock_model_view.custom_post_create = True
         mock_model_view.handle_post_create = AsyncMock(side_effect=Exception("Handle error"))
 
@@ -316,32 +346,47 @@ class TestAdminAppCreate:
 
 
 class TestAdminAppGetSaveRedirectUrl:
-    def test_get_save_redirect_url_base_model_view_no_custom_post_create(
+    @pytest.mark.parametrize(
+        "is_base_model_view, redirect_url",
+        (
+            (True, "http://example.com/redirect"),
+            (True, URL("http://example.com/redirect")),
+            (False, "http://example.com/redirect"),
+        ),
+        ids=("base-model-view", "base-model-view-url-object", "non-base-model-view"),
+    )
+    def test_get_save_redirect_url__delegates_to_super(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_form_data: FormData,
         mock_model_view: MagicMock,
         mock_base_model: MagicMock,
         mock_super_get_save_redirect_url: MagicMock,
+        is_base_model_view: bool,
+        redirect_url: str | URL,
     ) -> None:
-        mock_model_view.custom_post_create = False
-        mock_redirect_url = "http://example.com/redirect"
-        mock_super_get_save_redirect_url.return_value = mock_redirect_url
+        if is_base_model_view:
+            mock_model_view.custom_post_create = False
+            model_view = mock_model_view
+        else:
+            model_view = MagicMock()  # Not a BaseModelView
+
+        mock_super_get_save_redirect_url.return_value = redirect_url
 
         result = admin_app.get_save_redirect_url(
-            mock_request, mock_form_data, mock_model_view, mock_base_model
+            mock_request, mock_form_data, model_view, mock_base_model
         )
 
-        assert result == mock_redirect_url
+        assert result == redirect_url
         mock_super_get_save_redirect_url.assert_called_once_with(
-            mock_request, mock_form_data, mock_model_view, mock_base_model
+            mock_request, mock_form_data, model_view, mock_base_model
         )
 
     def test_get_save_redirect_url_base_model_view_with_custom_post_create(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_form_data: FormData,
         mock_model_view: MagicMock,
         mock_base_model: MagicMock,
@@ -354,27 +399,6 @@ class TestAdminAppGetSaveRedirectUrl:
         )
         assert result == "123"
 
-    def test_get_save_redirect_url_non_base_model_view(
-        self,
-        admin_app: AdminApp,
-        mock_request: MagicMock,
-        mock_form_data: FormData,
-        mock_base_model: MagicMock,
-        mock_super_get_save_redirect_url: MagicMock,
-    ) -> None:
-        mock_model_view = MagicMock()  # Not a BaseModelView
-        mock_redirect_url = "http://example.com/redirect"
-        mock_super_get_save_redirect_url.return_value = mock_redirect_url
-
-        result = admin_app.get_save_redirect_url(
-            mock_request, mock_form_data, mock_model_view, mock_base_model
-        )
-
-        assert result == mock_redirect_url
-        mock_super_get_save_redirect_url.assert_called_once_with(
-            mock_request, mock_form_data, mock_model_view, mock_base_model
-        )
-
 
 class TestAdminAppRegisterViews:
     @pytest.fixture
@@ -426,7 +450,7 @@ class TestMakeAdmin:
     def test_make_admin(
         self,
         test_app: ReleaseAgentAPP,
-        mock_session_factory: MagicMock,
+        mock_db_session_factory: MagicMock,
         mock_is_async_session_maker: MagicMock,
         mock_admin_auth_class: MagicMock,
     ) -> None:
@@ -442,12 +466,13 @@ class TestMakeAdmin:
     def test_make_admin_with_settings(
         self,
         test_app: ReleaseAgentAPP,
-        mock_session_factory: MagicMock,
+        mock_db_session_factory: MagicMock,
         mock_is_async_session_maker: MagicMock,
         mock_admin_auth_class: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        test_app.settings.admin.base_url = "/custom/admin"
-        test_app.settings.admin.title = "Custom Admin"
+        monkeypatch.setattr(test_app.settings.admin, "base_url", "/custom/admin")
+        monkeypatch.setattr(test_app.settings.admin, "title", "Custom Admin")
 
         result = make_admin(test_app)
 
@@ -473,7 +498,7 @@ class TestAdminAppEdgeCases:
     async def test_index_template_error(
         self,
         admin_app: AdminApp,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_get_settings: MagicMock,
         mock_uow_class: MagicMock,
         mock_counter_class: MagicMock,
@@ -505,31 +530,9 @@ class TestAdminAppEdgeCases:
             base_url="/admin",
             title="Test Admin",
             session_maker=mock_session_factory,
-            authentication_backend=AsyncMock(),
+            authentication_backend=NOOP_AUTH_BACKEND,
         )
         # This should call real _init_jinja_templates and _register_views
         assert admin.app == test_app
         assert admin.custom_templates_dir == "modules/admin/templates"
         assert isinstance(admin._views, list)
-
-    def test_get_save_redirect_url_with_url_object(
-        self,
-        admin_app: AdminApp,
-        mock_request: MagicMock,
-        mock_form_data: FormData,
-        mock_model_view: MagicMock,
-        mock_base_model: MagicMock,
-        mock_super_get_save_redirect_url: MagicMock,
-    ) -> None:
-        mock_model_view.custom_post_create = False
-        mock_redirect_url = URL("http://example.com/redirect")
-        mock_super_get_save_redirect_url.return_value = mock_redirect_url
-
-        result = admin_app.get_save_redirect_url(
-            mock_request, mock_form_data, mock_model_view, mock_base_model
-        )
-
-        assert result == mock_redirect_url
-        mock_super_get_save_redirect_url.assert_called_once_with(
-            mock_request, mock_form_data, mock_model_view, mock_base_model
-        )
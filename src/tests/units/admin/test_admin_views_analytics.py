@@ -11,17 +11,7 @@ from src.modules.admin.views.analytics import (
     AnalyticsDashboardCHAdminView,
     AnalyticsQueryAdminView,
 )
-from src.settings import AppSettings
 from src.settings.db import ClickHouseSettings
-from src.settings.log import LogSettings
-
-
-@pytest.fixture
-def app_settings_test() -> AppSettings:
-    return AppSettings(
-        app_secret_key=SecretStr("example-UStLb8mds9K"),
-        log=LogSettings(format="[%(levelname)s] %(message)s"),
-    )
 
 
 @pytest.fixture
@@ -67,7 +57,7 @@ def _mock_view_response(view: Any) -> AsyncMock:
 @pytest.mark.asyncio
 async def test_analytics_query_context_uses_settings(
     analytics_settings: None,
-    mock_request: MagicMock,
+    mock_request: SimpleNamespace,
 ) -> None:
     view = AnalyticsQueryAdminView()
     template_response = _mock_view_response(view)
@@ -89,7 +79,7 @@ async def test_analytics_query_context_uses_settings(
 @pytest.mark.asyncio
 async def test_clickhouse_dashboard_context_includes_stat_queries(
     analytics_settings: None,
-    mock_request: MagicMock,
+    mock_request: SimpleNamespace,
 ) -> None:
     view = AnalyticsDashboardCHAdminView()
     template_response = _mock_view_response(view)
@@ -114,7 +104,7 @@ async def test_clickhouse_dashboard_context_includes_stat_queries(
 @pytest.mark.asyncio
 async def test_internal_dashboard_context_uses_admin_base_url(
     analytics_settings: None,
-    mock_request: MagicMock,
+    mock_request: SimpleNamespace,
 ) -> None:
     view = AnalyticsDashboardAdminView()
     template_response = _mock_view_response(view)
@@ -150,7 +140,7 @@ async def test_chart_api_normalizes_request_parameters(
 
 def test_chart_api_view_is_hidden_from_admin_menu(
     analytics_settings: None,
-    mock_request: MagicMock,
+    mock_request: SimpleNamespace,
 ) -> None:
     view = APIAnalyticsDashboardAdminView()
 
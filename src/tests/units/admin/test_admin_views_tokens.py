@@ -1,5 +1,5 @@
 import datetime
-from typing import Any, Generator
+from typing import Any, Awaitable, Callable, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,13 +9,16 @@ from starlette.responses import RedirectResponse
 
 from src.modules.admin.views.tokens import TokenAdminView
 from src.db.models import Token
+from src.main import ReleaseAgentAPP
 from src.tests.mocks import MockUser
 
+FUTURE_EXPIRY = datetime.datetime(2099, 1, 1)
 
-@pytest.fixture
-def token_admin_view(test_app: MagicMock) -> TokenAdminView:
+
+@pytest.fixture(scope="module")
+def token_admin_view(session_app: ReleaseAgentAPP) -> TokenAdminView:
     view = TokenAdminView()
-    view.app = test_app
+    view.app = session_app
     return view
 
 
@@ -24,7 +27,7 @@ def mock_request() -> MagicMock:
     request = MagicMock(spec=Request)
     request.query_params = {"pks": "1,2,3"}
     request.url_for = MagicMock()
-    request.url_for.return_value = "/admin/tokens/list"
+    request.url_for.return_value = URL("http://testserver/admin/tokens/list")
     return request
 
 
@@ -42,7 +45,7 @@ def mock_token(mock_user: MockUser) -> MagicMock:
     token.name = "test-token"
     token.token = "hashed-token-value"
     token.is_active = True
-    token.expires_at = datetime.datetime.now() + datetime.timedelta(days=30)
+    token.expires_at = FUTURE_EXPIRY
     token.created_at = datetime.datetime.now()
     return token
 
@@ -52,7 +55,7 @@ def mock_form_data() -> dict[str, Any]:
     return {
         "user": 1,
         "name": "test-token",
-        "expires_at": datetime.datetime.now() + datetime.timedelta(days=30),
+        "expires_at": FUTURE_EXPIRY,
     }
 
 
@@ -98,7 +101,6 @@ def mock_make_api_token() -> Generator[MagicMock, Any, None]:
 
 class TestTokenAdminViewInsertModel:
 
-    @pytest.mark.asyncio
     async def test_insert_model_success(
         self,
         token_admin_view: TokenAdminView,
@@ -121,7 +123,6 @@ class TestTokenAdminViewInsertModel:
         assert call_args[0][1] == "raw-token-value"
         assert call_args[1]["ttl"] == 10
 
-    @pytest.mark.asyncio
     async def test_insert_model_without_expiration(
         self,
         token_admin_view: TokenAdminView,
@@ -143,7 +144,6 @@ class TestTokenAdminViewInsertModel:
             expires_at=None, settings=token_admin_view.app.settings
         )
 
-    @pytest.mark.asyncio
     async def test_insert_model_with_expiration(
         self,
         token_admin_view: TokenAdminView,
@@ -154,22 +154,56 @@ class TestTokenAdminViewInsertModel:
         mock_super_model_view_insert: MagicMock,
     ) -> None:
         mock_super_model_view_insert.return_value = mock_token
-        expires_at = datetime.datetime.now() + datetime.timedelta(days=30)
 
         result = await token_admin_view.insert_model(
             mock_request,
-            data={"user": 1, "name": "test-token", "expires_at": expires_at},
+            data={"user": 1, "name": "test-token", "expires_at": FUTURE_EXPIRY},
         )
 
         assert result == mock_token
         mock_make_api_token.assert_called_once_with(
-            expires_at=expires_at, settings=token_admin_view.app.settings
+            expires_at=FUTURE_EXPIRY, settings=token_admin_view.app.settings
         )
 
+    async def test_insert_model__invalidates_token_state(
+        self,
+        token_admin_view: TokenAdminView,
+        mock_request: MagicMock,
+        mock_form_data: dict[str, Any],
+        mock_token: Token,
+        mock_cache: MagicMock,
+        mock_make_api_token: MagicMock,
+        mock_super_model_view_insert: MagicMock,
+    ) -> None:
+        mock_super_model_view_insert.return_value = mock_token
+
+        await token_admin_view.insert_model(mock_request, mock_form_data)
+
+        mock_cache.invalidate.assert_awaited_once_with("api_token__hashed-token-value")
+
+
+class TestTokenAdminViewUpdateModel:
+
+    async def test_update_model__invalidates_token_states(
+        self,
+        token_admin_view: TokenAdminView,
+        mock_request: MagicMock,
+        mock_token: Token,
+        mock_cache: MagicMock,
+        mock_super_model_view_update: MagicMock,
+    ) -> None:
+        mock_super_model_view_update.return_value = mock_token
+        data = {"is_active": False}
+
+        result = await token_admin_view.update_model(mock_request, pk="1", data=data)
+
+        assert result == mock_token
+        mock_super_model_view_update.assert_called_once_with(mock_request, "1", data)
+        mock_cache.invalidate.assert_awaited_once_with(pattern="api_token__*")
+
 
 class TestTokenAdminViewOperations:
 
-    @pytest.mark.asyncio
     async def test_get_object_for_details_success(
         self,
         token_admin_view: TokenAdminView,
@@ -180,7 +214,7 @@ class TestTokenAdminViewOperations:
     ) -> None:
         # Setup mocks
         mock_super_model_view_get_details.return_value = mock_token
-        mock_cache.get = AsyncMock(return_value="raw-token-value")
+        mock_cache.get.return_value = "raw-token-value"
 
         result = await token_admin_view.get_object_for_details(request=mock_request)
 
@@ -191,7 +225,6 @@ class TestTokenAdminViewOperations:
         mock_cache.invalidate.assert_called_once()
         assert mock_cache.invalidate.call_args[0][0] == f"token__{mock_token.id}"
 
-    @pytest.mark.asyncio
     async def test_get_object_for_details_no_cache(
         self,
         token_admin_view: TokenAdminView,
@@ -201,7 +234,6 @@ class TestTokenAdminViewOperations:
         mock_super_model_view_get_details: MagicMock,
     ) -> None:
         mock_super_model_view_get_details.return_value = mock_token
-        mock_cache.get = AsyncMock(return_value=None)
 
         result = await token_admin_view.get_object_for_details(1)
 
@@ -230,7 +262,6 @@ class TestTokenAdminViewOperations:
         )
 
 
-@pytest.mark.asyncio
 class TestTokenAdminViewActions:
 
     @pytest.fixture
@@ -238,55 +269,60 @@ class TestTokenAdminViewActions:
         with patch("src.modules.admin.views.tokens.TokenAdminView._set_active") as mock_set_active:
             yield mock_set_active
 
-    async def test_deactivate_tokens_success(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_set_active: MagicMock,
-    ) -> None:
-        mock_set_active.return_value = RedirectResponse("/admin/tokens/list")
-        result = await token_admin_view.deactivate_tokens(mock_request)
-
-        assert isinstance(result, RedirectResponse)
-        mock_set_active.assert_called_once_with(mock_request, is_active=False)
-
-    async def test_activate_tokens_success(
+    @pytest.mark.parametrize(
+        "method, is_active",
+        (("activate_tokens", True), ("deactivate_tokens", False)),
+        ids=("activate", "deactivate"),
+    )
+    async def test_toggle_tokens_success(
         self,
         token_admin_view: TokenAdminView,
         mock_request: MagicMock,
         mock_set_active: MagicMock,
+        method: str,
+        is_active: bool,
     ) -> None:
         mock_set_active.return_value = RedirectResponse("/admin/tokens/list")
 
-        result = await token_admin_view.activate_tokens(mock_request)
+        result = await getattr(token_admin_view, method)(mock_request)
 
         assert isinstance(result, RedirectResponse)
-        mock_set_active.assert_called_once_with(mock_request, is_active=True)
+        mock_set_active.assert_called_once_with(mock_request, is_active=is_active)
 
 
 class TestTokenAdminViewSetActive:
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("is_active", (True, False), ids=("activate", "deactivate"))
     async def test_set_active_success(
         self,
         token_admin_view: TokenAdminView,
         mock_request: MagicMock,
         mock_token_repository: AsyncMock,
         mock_uow: AsyncMock,
+        is_active: bool,
     ) -> None:
         # Setup mocks
         mock_uow.session = MagicMock()
         mock_token_repository.set_active.return_value = None
 
         # Execute
-        result = await token_admin_view._set_active(mock_request, is_active=True)
+        result = await token_admin_view._set_active(mock_request, is_active=is_active)
 
         # Verify
         assert isinstance(result, RedirectResponse)
-        mock_token_repository.set_active.assert_called_once_with([1, 2, 3], is_active=True)
+        assert result.headers["location"] == "/admin/tokens/list"
+        mock_token_repository.set_active.assert_called_once_with([1, 2, 3], is_active=is_active)
         mock_uow.commit.assert_called_once()
 
-    @pytest.mark.asyncio
+    def test_list_url_path__cached_per_view(self, mock_request: MagicMock) -> None:
+        views = (TokenAdminView(), TokenAdminView())
+        for view, base_url in zip(views, ("/admin", "/custom-admin")):
+            mock_request.url_for.return_value = URL(f"http://testserver{base_url}/tokens/list")
+            assert view._get_list_url_path(mock_request) == f"{base_url}/tokens/list"
+
+        assert views[0]._get_list_url_path(mock_request) == "/admin/tokens/list"
+        assert TokenAdminView._list_url_path is None
+
     async def test_set_active_no_pks(
         self,
         token_admin_view: TokenAdminView,
@@ -304,7 +340,6 @@ class TestTokenAdminViewSetActive:
 
         mock_token_repository.set_active.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_set_active_empty_pks(
         self,
         token_admin_view: TokenAdminView,
@@ -322,56 +357,35 @@ class TestTokenAdminViewSetActive:
 
         mock_token_repository.set_active.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_set_active_deactivate(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_token_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-        # Setup mocks
-        mock_uow.session = MagicMock()
-        mock_token_repository.set_active.return_value = None
-
-        # Execute
-        result = await token_admin_view._set_active(mock_request, is_active=False)
-
-        # Verify
-        assert isinstance(result, RedirectResponse)
-        mock_token_repository.set_active.assert_called_once_with([1, 2, 3], is_active=False)
-        mock_uow.commit.assert_called_once()
-
 
 class TestTokenAdminViewEdgeCases:
 
-    @pytest.mark.asyncio
-    async def test_insert_model_database_error(
+    @pytest.mark.parametrize(
+        "target, call",
+        (
+            (
+                "sqladmin.models.ModelView.insert_model",
+                lambda view, request: view.insert_model(request, {"user": 1, "name": "test"}),
+            ),
+            (
+                "sqladmin.models.ModelView.get_object_for_details",
+                lambda view, request: view.get_object_for_details(request),
+            ),
+        ),
+        ids=("insert-model", "get-object-for-details"),
+    )
+    async def test_super_model_view_error(
         self,
         token_admin_view: TokenAdminView,
         mock_request: MagicMock,
-        mock_form_data: dict[str, Any],
-        mock_super_model_view_insert: MagicMock,
-    ) -> None:
-        mock_super_model_view_insert.side_effect = Exception("Database error")
-
-        with pytest.raises(Exception, match="Database error"):
-            await token_admin_view.insert_model(mock_request, mock_form_data)
-
-    @pytest.mark.asyncio
-    async def test_get_object_for_details_database_error(
-        self,
-        token_admin_view: TokenAdminView,
-        mock_request: MagicMock,
-        mock_cache: MagicMock,
-        mock_super_model_view_get_details: MagicMock,
+        mock_make_api_token: MagicMock,
+        target: str,
+        call: Callable[[TokenAdminView, MagicMock], Awaitable[Any]],
     ) -> None:
-        mock_super_model_view_get_details.side_effect = Exception("Database error")
-
-        with pytest.raises(Exception, match="Database error"):
-            await token_admin_view.get_object_for_details(1)
+        with patch(target, side_effect=Exception("Database error")):
+            with pytest.raises(Exception, match="Database error"):
+                await call(token_admin_view, mock_request)
 
-    @pytest.mark.asyncio
     async def test_set_active_database_error(
         self,
         token_admin_view: TokenAdminView,
@@ -379,7 +393,6 @@ class TestTokenAdminViewEdgeCases:
         mock_token_repository: AsyncMock,
         mock_uow: AsyncMock,
     ) -> None:
-        mock_uow.session = MagicMock()
         mock_token_repository.set_active.side_effect = Exception("Database error")
 
         with pytest.raises(Exception, match="Database error"):
@@ -1,4 +1,5 @@
-from typing import Any, Generator
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -26,10 +27,10 @@ def mock_uow() -> Generator[AsyncMock, Any, None]:
         yield mock_uow
 
 
-@pytest.fixture
-def user_admin_view(test_app: ReleaseAgentAPP) -> UserAdminView:
+@pytest.fixture(scope="module")
+def user_admin_view(session_app: ReleaseAgentAPP) -> UserAdminView:
     view = UserAdminView()
-    view.app = test_app
+    view.app = session_app
     return view
 
 
@@ -41,6 +42,16 @@ def mock_user_repository() -> Generator[AsyncMock, Any, None]:
         yield mock_repo
 
 
+@pytest.fixture
+def base_user_data() -> FormDataType:
+    return {
+        "username": "new-user",
+        "email": "new-user@example.com",
+        "is_admin": False,
+        "is_active": True,
+    }
+
+
 class TestUserAdminForm:
 
     def test_form_creation(self) -> None:
@@ -116,26 +127,20 @@ class TestUserAdminForm:
 
 class TestUserAdminViewInsertModel:
 
-    @pytest.mark.asyncio
     async def test_insert_model_success(
         self,
         user_admin_view: UserAdminView,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user: MockUser,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
         mock_user_make_password: MagicMock,
         mock_super_model_view_insert: MagicMock,
+        base_user_data: FormDataType,
     ) -> None:
         mock_super_model_view_insert.return_value = mock_user
-        mock_user_repository.get_by_username.return_value = None
-        user_data: FormDataType = {
-            "username": "new-user",
-            "email": "new-user@example.com",
-            "new_password": "password123",
-            "is_admin": False,
-            "is_active": True,
-        }
+        mock_user_repository.username_exists.return_value = False
+        user_data: FormDataType = {**base_user_data, "new_password": "password123"}
 
         result = await user_admin_view.insert_model(mock_request, data=user_data)
 
@@ -146,87 +151,59 @@ class TestUserAdminViewInsertModel:
         # assert call_args[1]["password"] == "hashed-password"
         # assert "new_password" not in call_args[1]
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "password_data",
+        ({}, {"new_password": ""}, {"new_password": None}),
+        ids=("missing", "empty", "none"),
+    )
     async def test_insert_model_no_password(
         self,
         user_admin_view: UserAdminView,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
+        base_user_data: FormDataType,
+        password_data: FormDataType,
     ) -> None:
-
         with pytest.raises(HTTPException) as exc_info:
             await user_admin_view.insert_model(
-                mock_request,
-                data={
-                    "username": "new-user",
-                    "email": "new-user@example.com",
-                    "is_admin": False,
-                    "is_active": True,
-                },
+                mock_request, data={**base_user_data, **password_data}
             )
 
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == "Password required"
 
-    @pytest.mark.asyncio
     async def test_insert_model_username_taken(
         self,
         user_admin_view: UserAdminView,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user: MockUser,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
+        base_user_data: FormDataType,
     ) -> None:
-        mock_user_repository.get_by_username.return_value = mock_user
+        mock_user_repository.username_exists.return_value = True
 
         with pytest.raises(HTTPException) as exc_info:
             await user_admin_view.insert_model(
                 mock_request,
                 data={
+                    **base_user_data,
                     "username": "existing-user",
-                    "email": "new-user@example.com",
                     "new_password": "password123",
-                    "is_admin": False,
-                    "is_active": True,
                 },
             )
 
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == "Username already taken"
 
-    @pytest.mark.asyncio
-    async def test_insert_model_database_error(
-        self,
-        user_admin_view: UserAdminView,
-        mock_request: MagicMock,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-
-        mock_user_repository.get_by_username.side_effect = Exception("Database error")
-
-        # Execute and expect exception
-        with pytest.raises(Exception, match="Database error"):
-            await user_admin_view.insert_model(
-                mock_request,
-                data={
-                    "username": "new-user",
-                    "email": "new-user@example.com",
-                    "new_password": "password123",
-                    "is_admin": False,
-                    "is_active": True,
-                },
-            )
-
 
 class TestUserAdminViewUpdateModel:
 
-    @pytest.mark.asyncio
     async def test_update_model_success_with_password(
         self,
         user_admin_view: UserAdminView,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user: MockUser,
         mock_user_make_password: MagicMock,
         mock_super_model_view_update: MagicMock,
@@ -259,11 +236,10 @@ class TestUserAdminViewUpdateModel:
         assert "new_password" not in call_args[2]
         assert "repeat_password" not in call_args[2]
 
-    @pytest.mark.asyncio
     async def test_update_model_success_without_password(
         self,
         user_admin_view: UserAdminView,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_user: MockUser,
         mock_super_model_view_update: MagicMock,
     ) -> None:
@@ -285,45 +261,23 @@ class TestUserAdminViewUpdateModel:
             mock_request, str(mock_user.id), update_user_data
         )
 
-    @pytest.mark.asyncio
-    async def test_update_model_database_error(
-        self,
-        user_admin_view: UserAdminView,
-        mock_request: MagicMock,
-        mock_user: MockUser,
-        mock_super_model_view_update: MagicMock,
-    ) -> None:
-        mock_super_model_view_update.side_effect = Exception("Database error")
-        with pytest.raises(Exception, match="Database error"):
-            await user_admin_view.update_model(
-                mock_request,
-                pk=str(mock_user.id),
-                data={
-                    "email": "updated@example.com",
-                    "is_admin": True,
-                    "is_active": True,
-                },
-            )
-
 
 class TestUserAdminViewValidateUsername:
 
-    @pytest.mark.asyncio
     async def test_validate_username_success(
         self,
         mock_user_repository: AsyncMock,
         mock_uow: AsyncMock,
     ) -> None:
         # Setup mocks
-        mock_user_repository.get_by_username.return_value = None
+        mock_user_repository.username_exists.return_value = False
 
         # Execute
         await UserAdminView._validate_username("new-username")
 
         # Verify
-        mock_user_repository.get_by_username.assert_called_once_with("new-username")
+        mock_user_repository.username_exists.assert_called_once_with("new-username")
 
-    @pytest.mark.asyncio
     async def test_validate_username_taken(
         self,
         mock_user: MockUser,
@@ -331,7 +285,7 @@ class TestUserAdminViewValidateUsername:
         mock_uow: AsyncMock,
     ) -> None:
         # Setup mocks
-        mock_user_repository.get_by_username.return_value = mock_user
+        mock_user_repository.username_exists.return_value = True
 
         # Execute and expect exception
         with pytest.raises(HTTPException) as exc_info:
@@ -341,21 +295,42 @@ class TestUserAdminViewValidateUsername:
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == "Username already taken"
 
-    @pytest.mark.asyncio
-    async def test_validate_username_database_error(
+
+class TestUserAdminViewEdgeCases:
+
+    @pytest.mark.parametrize(
+        "call",
+        (
+            lambda view, request: view.insert_model(
+                request, {"username": "new-user", "new_password": "password123"}
+            ),
+            lambda view, request: view._validate_username("test-username"),
+        ),
+        ids=("insert-model", "validate-username"),
+    )
+    async def test_user_repository_error(
         self,
-        mock_user_repository: AsyncMock,
+        user_admin_view: UserAdminView,
+        mock_request: SimpleNamespace,
         mock_uow: AsyncMock,
+        mock_user_repository: AsyncMock,
+        call: Callable[[UserAdminView, SimpleNamespace], Awaitable[Any]],
     ) -> None:
-        # Setup mocks
-        mock_user_repository.get_by_username.side_effect = Exception("Database error")
+        mock_user_repository.username_exists.side_effect = Exception("Database error")
 
-        # Execute and expect exception
         with pytest.raises(Exception, match="Database error"):
-            await UserAdminView._validate_username("test-username")
+            await call(user_admin_view, mock_request)
 
+    async def test_update_model_database_error(
+        self,
+        user_admin_view: UserAdminView,
+        mock_request: SimpleNamespace,
+        mock_super_model_view_update: MagicMock,
+    ) -> None:
+        mock_super_model_view_update.side_effect = Exception("Database error")
 
-class TestUserAdminViewEdgeCases:
+        with pytest.raises(Exception, match="Database error"):
+            await user_admin_view.update_model(mock_request, pk="1", data={"is_active": True})
 
     def test_form_field_attributes(self) -> None:
         form = UserAdminForm()
@@ -376,55 +351,6 @@ class TestUserAdminViewEdgeCases:
         assert form.is_admin.label.text == "Is Admin"
         assert form.is_active.label.text == "Is Active"
 
-    @pytest.mark.asyncio
-    async def test_insert_model_empty_password(
-        self,
-        user_admin_view: UserAdminView,
-        mock_request: MagicMock,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-
-        with pytest.raises(HTTPException) as exc_info:
-            await user_admin_view.insert_model(
-                mock_request,
-                data={
-                    "username": "new-user",
-                    "email": "new-user@example.com",
-                    "new_password": "",
-                    "is_admin": False,
-                    "is_active": True,
-                },
-            )
-
-        # Verify
-        assert exc_info.value.status_code == 400
-        assert exc_info.value.detail == "Password required"
-
-    @pytest.mark.asyncio
-    async def test_insert_model_none_password(
-        self,
-        user_admin_view: UserAdminView,
-        mock_request: MagicMock,
-        mock_user_repository: AsyncMock,
-        mock_uow: AsyncMock,
-    ) -> None:
-
-        with pytest.raises(HTTPException) as exc_info:
-            await user_admin_view.insert_model(
-                mock_request,
-                data={
-                    "username": "new-user",
-                    "email": "new-user@example.com",
-                    "new_password": None,
-                    "is_admin": False,
-                    "is_active": True,
-                },
-            )
-
-        assert exc_info.value.status_code == 400
-        assert exc_info.value.detail == "Password required"
-
     def test_form_validation_with_none_values(self) -> None:
         form = UserAdminForm()
         form.process(
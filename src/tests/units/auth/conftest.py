@@ -29,7 +29,9 @@ def mock_hash_token() -> Generator[MagicMock, Any, None]:
 
 
 @pytest.fixture
-def mock_db_api_token__inactive() -> Generator[MockAPIToken, Any, None]:
+def mock_db_api_token__inactive(
+    mock_db_session_factory: MagicMock,
+) -> Generator[MockAPIToken, Any, None]:
     with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
         mock_token = MockAPIToken(is_active=False, user=MockUser(id=1, is_active=True))
         mock_get_by_token.return_value = mock_token
@@ -37,7 +39,9 @@ def mock_db_api_token__inactive() -> Generator[MockAPIToken, Any, None]:
 
 
 @pytest.fixture
-def mock_db_api_token__user_inactive() -> Generator[MockAPIToken, Any, None]:
+def mock_db_api_token__user_inactive(
+    mock_db_session_factory: MagicMock,
+) -> Generator[MockAPIToken, Any, None]:
     with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
         mock_token = MockAPIToken(is_active=True, user=MockUser(id=1, is_active=False))
         mock_get_by_token.return_value = mock_token
@@ -45,14 +49,18 @@ def mock_db_api_token__user_inactive() -> Generator[MockAPIToken, Any, None]:
 
 
 @pytest.fixture
-def mock_db_api_token__unknown() -> Generator[AsyncMock, Any, None]:
+def mock_db_api_token__unknown(
+    mock_db_session_factory: MagicMock,
+) -> Generator[AsyncMock, Any, None]:
     with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
         mock_get_by_token.return_value = None
         yield mock_get_by_token
 
 
 @pytest.fixture
-def mock_db_api_token__repository_error() -> Generator[AsyncMock, Any, None]:
+def mock_db_api_token__repository_error(
+    mock_db_session_factory: MagicMock,
+) -> Generator[AsyncMock, Any, None]:
     with patch("src.db.repositories.TokenRepository.get_by_token") as mock_get_by_token:
         mock_get_by_token.side_effect = RuntimeError("Database error")
         yield mock_get_by_token
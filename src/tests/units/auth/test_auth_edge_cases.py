@@ -1,4 +1,5 @@
 import datetime
+from types import SimpleNamespace
 import pytest
 from unittest.mock import MagicMock
 from pydantic import SecretStr
@@ -270,7 +271,7 @@ class TestAuthDependencyEdgeCases:
     async def test_verify_api_token_with_whitespace_edge_cases(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         auth_token: str,
         should_raise: bool,
         expected_detail_contains: str,
@@ -293,7 +294,7 @@ class TestAuthDependencyEdgeCases:
     async def test_verify_api_token_with_case_insensitive_bearer(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_decode_token: MagicMock,
         mock_hash_token: MagicMock,
         mock_db_api_token__active: MockAPIToken,
@@ -1,6 +1,7 @@
 import datetime
+from types import SimpleNamespace
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import AsyncMock
 from starlette.exceptions import HTTPException
 
 from src.modules.auth.tokens import (
@@ -12,6 +13,7 @@ from src.modules.auth.tokens import (
     hash_token,
     verify_api_token,
     GeneratedToken,
+    _jwt_header_for,
 )
 from src.settings import AppSettings
 from src.tests.mocks import MockAPIToken
@@ -119,9 +121,12 @@ class TestDecodeAPIToken:
         assert decoded.sub is not None
         assert len(decoded.sub) > 0
 
-    def test_decode_api_token_invalid_length_prefix(self, app_settings_test: AppSettings) -> None:
+    @pytest.mark.parametrize("token", ("invalid-token", "invalid-token1²3", "token000", "t999"))
+    def test_decode_api_token_invalid_length_prefix(
+        self, app_settings_test: AppSettings, token: str
+    ) -> None:
         with pytest.raises(HTTPException) as exc_info:
-            decode_api_token("invalid-token", app_settings_test)
+            decode_api_token(token, app_settings_test)
 
         assert exc_info.value.status_code == 401
         assert "Invalid token signature" in str(exc_info.value.detail)
@@ -144,6 +149,17 @@ class TestDecodeAPIToken:
         assert exc_info.value.status_code == 401
         assert "Invalid token" in str(exc_info.value.detail)
 
+    @pytest.mark.parametrize("algorithm", ("HS256", "HS384", "HS512"))
+    def test_jwt_header_matches_pyjwt(
+        self,
+        app_settings_test: AppSettings,
+        algorithm: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(app_settings_test, "jwt_algorithm", algorithm)
+        token = jwt_encode(JWTPayload(sub="test-user"), app_settings_test)
+        assert _jwt_header_for(algorithm) == token.split(".")[0]
+
 
 class TestHashToken:
 
@@ -182,7 +198,7 @@ class TestHashToken:
 class TestVerifyAPIToken:
 
     async def test_verify_api_token_options_method(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+        self, app_settings_test: AppSettings, mock_request: SimpleNamespace
     ) -> None:
         mock_request.method = "OPTIONS"
 
@@ -191,7 +207,7 @@ class TestVerifyAPIToken:
         assert result == ""
 
     async def test_verify_api_token_no_token(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+        self, app_settings_test: AppSettings, mock_request: SimpleNamespace
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token=None)
@@ -202,7 +218,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_with_bearer_prefix(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_db_api_token__active: MockAPIToken,
     ) -> None:
         generated_token = make_api_token(expires_at=None, settings=app_settings_test)
@@ -216,7 +232,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_inactive_token(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_db_api_token__inactive: MockAPIToken,
     ) -> None:
         generated = make_api_token(expires_at=None, settings=app_settings_test)
@@ -231,7 +247,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_inactive_user(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_db_api_token__user_inactive: MockAPIToken,
     ) -> None:
         generated = make_api_token(expires_at=None, settings=app_settings_test)
@@ -246,7 +262,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_unknown_token(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_db_api_token__unknown: AsyncMock,
     ) -> None:
         generated = make_api_token(expires_at=None, settings=app_settings_test)
@@ -1,12 +1,15 @@
+from types import SimpleNamespace
 from datetime import timedelta
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from starlette.exceptions import HTTPException
 
+from src.constants import CACHE_TTL_API_TOKEN_UNKNOWN
 from src.modules.auth.dependencies import verify_api_token
 from src.modules.auth.tokens import make_api_token
+from src.services.cache import InMemoryCache, invalidate_api_token_cache
 from src.settings import AppSettings
 from src.utils import utcnow
 from src.tests.mocks import MockAPIToken
@@ -21,7 +24,7 @@ class TestVerifyAPIToken:
         assert callable(verify_api_token)
 
     async def test_verify_api_token_options_method(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+        self, app_settings_test: AppSettings, mock_request: SimpleNamespace
     ) -> None:
         mock_request.method = "OPTIONS"
 
@@ -30,7 +33,7 @@ class TestVerifyAPIToken:
         assert result == ""
 
     async def test_verify_api_token_no_token(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+        self, app_settings_test: AppSettings, mock_request: SimpleNamespace
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token=None)
@@ -39,7 +42,7 @@ class TestVerifyAPIToken:
         assert "Not authenticated" in str(exc_info.value.detail)
 
     async def test_verify_api_token_empty_token(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+        self, app_settings_test: AppSettings, mock_request: SimpleNamespace
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token="")
@@ -48,7 +51,7 @@ class TestVerifyAPIToken:
         assert "Not authenticated" in str(exc_info.value.detail)
 
     async def test_verify_api_token_whitespace_token(
-        self, app_settings_test: AppSettings, mock_request: MagicMock
+        self, app_settings_test: AppSettings, mock_request: SimpleNamespace
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
             await verify_api_token(mock_request, app_settings_test, auth_token="   ")
@@ -59,7 +62,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_with_bearer_prefix(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_db_api_token__active: MockAPIToken,
     ) -> None:
         auth_token = make_api_token(
@@ -77,7 +80,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_without_bearer_prefix(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_decode_token: MagicMock,
         mock_hash_token: MagicMock,
         mock_db_api_token__active: MockAPIToken,
@@ -89,7 +92,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_inactive_token(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_decode_token: MagicMock,
         mock_hash_token: MagicMock,
         mock_db_api_token__inactive: MockAPIToken,
@@ -103,7 +106,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_inactive_user(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_decode_token: MagicMock,
         mock_hash_token: MagicMock,
         mock_db_api_token__user_inactive: MockAPIToken,
@@ -117,7 +120,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_unknown_token(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_decode_token: MagicMock,
         mock_hash_token: MagicMock,
         mock_db_api_token__unknown: AsyncMock,
@@ -129,10 +132,72 @@ class TestVerifyAPIToken:
         assert "unknown token" in str(exc_info.value.detail)
         mock_db_api_token__unknown.assert_awaited_with(mock_hash_token.return_value)
 
+    async def test_verify_api_token_cached_state(
+        self,
+        app_settings_test: AppSettings,
+        mock_request: SimpleNamespace,
+        mock_decode_token: MagicMock,
+        mock_hash_token: MagicMock,
+        mock_db_api_token__unknown: AsyncMock,
+    ) -> None:
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
+
+            assert "unknown token" in str(exc_info.value.detail)
+
+        mock_db_api_token__unknown.assert_awaited_once_with(mock_hash_token.return_value)
+
+    async def test_verify_api_token_unknown_token__short_ttl(
+        self,
+        app_settings_test: AppSettings,
+        mock_request: SimpleNamespace,
+        mock_decode_token: MagicMock,
+        mock_hash_token: MagicMock,
+        mock_db_api_token__unknown: AsyncMock,
+    ) -> None:
+        with patch.object(InMemoryCache(), "set", AsyncMock()) as mock_cache_set:
+            with pytest.raises(HTTPException):
+                await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
+
+        assert mock_cache_set.call_args.kwargs["ttl"] == CACHE_TTL_API_TOKEN_UNKNOWN
+
+    async def test_verify_api_token_cache_disabled(
+        self,
+        app_settings_test: AppSettings,
+        mock_request: SimpleNamespace,
+        mock_decode_token: MagicMock,
+        mock_hash_token: MagicMock,
+        mock_db_api_token__unknown: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(app_settings_test.flags, "api_token_cache_enabled", False)
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
+
+        assert mock_db_api_token__unknown.await_count == 2
+
+    async def test_verify_api_token_cache_invalidated(
+        self,
+        app_settings_test: AppSettings,
+        mock_request: SimpleNamespace,
+        mock_decode_token: MagicMock,
+        mock_hash_token: MagicMock,
+        mock_db_api_token__unknown: AsyncMock,
+    ) -> None:
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await verify_api_token(mock_request, app_settings_test, auth_token="test-token")
+
+            await invalidate_api_token_cache()
+
+        assert mock_db_api_token__unknown.await_count == 2
+
     async def test_verify_api_token_no_identity(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_decode_token__no_identity: MagicMock,
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
@@ -144,7 +209,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_none_identity(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_decode_token__none_identity: MagicMock,
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
@@ -156,7 +221,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_database_error(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_decode_token: MagicMock,
         mock_hash_token: MagicMock,
         mock_db_api_token__repository_error: AsyncMock,
@@ -169,7 +234,7 @@ class TestVerifyAPIToken:
     async def test_verify_api_token_decode_error(
         self,
         app_settings_test: AppSettings,
-        mock_request: MagicMock,
+        mock_request: SimpleNamespace,
         mock_decode_token__error: MagicMock,
     ) -> None:
         with pytest.raises(HTTPException) as exc_info:
@@ -1,3 +1,4 @@
+import os
 from typing import Generator, Any
 
 import pytest
@@ -8,6 +9,20 @@ from _pytest.capture import CaptureFixture
 
 from src.modules.cli.generate_secrets import main
 
+_FAKE_ENV_FD = -100
+_os_open = os.open
+_os_close = os.close
+
+
+def _fake_os_open(path: Any, flags: int, mode: int = 0o777, **kwargs: Any) -> int:
+    """Fake fd for .env file only (pytest's capturing uses os.open too)"""
+    if path == Path(".env"):
+        assert flags == os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        assert mode == 0o600
+        return _FAKE_ENV_FD
+
+    return _os_open(path, flags, mode, **kwargs)
+
 
 @pytest.fixture
 def mock_secrets() -> Generator[MagicMock, Any, None]:
@@ -26,10 +41,20 @@ def mock_secrets() -> Generator[MagicMock, Any, None]:
 @pytest.fixture
 def mock_file_operations() -> Generator[MagicMock, Any, None]:
     """Mock file operations for testing .env file writing."""
-    with patch("builtins.open", mock_open()) as mock_file:
+    with (
+        patch("src.modules.cli.generate_secrets.os.open", new=_fake_os_open),
+        patch("src.modules.cli.generate_secrets.os.fdopen", mock_open()) as mock_file,
+    ):
         yield mock_file
 
 
+@pytest.fixture
+def mock_env_file_exists() -> Generator[MagicMock, Any, None]:
+    """Mock existing .env file."""
+    with patch.object(Path, "exists", return_value=True) as mock_exists:
+        yield mock_exists
+
+
 def test_main_writes_secrets_to_env_file(
     mock_secrets: MagicMock,
     mock_file_operations: MagicMock,
@@ -38,7 +63,7 @@ def test_main_writes_secrets_to_env_file(
     """Test that main function writes secrets to .env file."""
     main()
 
-    mock_file_operations.assert_called_once_with(Path(".env"), "a", encoding="utf-8")
+    mock_file_operations.assert_called_once_with(_FAKE_ENV_FD, "a", encoding="utf-8")
 
     file_handle = mock_file_operations()
     written_content = file_handle.write.call_args[0][0]
@@ -62,6 +87,7 @@ def test_main_writes_secrets_to_env_file(
 def test_main_changes_file_permissions_successfully(
     mock_secrets: MagicMock,
     mock_file_operations: MagicMock,
+    mock_env_file_exists: MagicMock,
     capsys: CaptureFixture[str],
 ) -> None:
     """Test that main function successfully changes file permissions to 600."""
@@ -76,9 +102,26 @@ def test_main_changes_file_permissions_successfully(
         assert "✅ Permissions changed to 600 for .env" in captured.out
 
 
+def test_main_skips_chmod_for_new_file(
+    mock_secrets: MagicMock,
+    mock_file_operations: MagicMock,
+    capsys: CaptureFixture[str],
+) -> None:
+    """Test that new .env file is created with 600 permissions (no extra chmod)."""
+    with (
+        patch.object(Path, "exists", return_value=False),
+        patch("os.chmod") as mock_chmod,
+    ):
+        main()
+
+    mock_chmod.assert_not_called()
+    assert "✅ Secrets written to .env" in capsys.readouterr().out
+
+
 def test_main_handles_permission_change_error(
     mock_secrets: MagicMock,
     mock_file_operations: MagicMock,
+    mock_env_file_exists: MagicMock,
     capsys: CaptureFixture[str],
 ) -> None:
     """Test that main function handles permission change errors gracefully."""
@@ -100,9 +143,27 @@ def test_main_handles_file_write_error(
     capsys: CaptureFixture[str],
 ) -> None:
     """Test that main function handles file write errors gracefully."""
-    with patch("builtins.open", side_effect=PermissionError("Permission denied")):
+    closed_fds: list[int] = []
+
+    def fake_os_close(fd: int) -> None:
+        """Record closing of the fake .env fd only (pytest's capturing uses os.close too)"""
+        if fd == _FAKE_ENV_FD:
+            closed_fds.append(fd)
+        else:
+            _os_close(fd)
+
+    with (
+        patch(
+            "src.modules.cli.generate_secrets.os.fdopen",
+            side_effect=PermissionError("Permission denied"),
+        ),
+        patch("src.modules.cli.generate_secrets.os.close", new=fake_os_close),
+    ):
         main()
 
+        # fd isn't leaked when the file object can't be created
+        assert closed_fds == [_FAKE_ENV_FD]
+
         # Verify error message is displayed
         captured = capsys.readouterr()
         assert "⚠️  Warning: Could not write to .env file:" in captured.out
@@ -167,8 +228,6 @@ def test_mocks_prevent_real_file_writing(
     original_content = test_env_file.read_text()
 
     # Temporarily change working directory to temp path
-    import os
-
     original_cwd = os.getcwd()
     os.chdir(tmp_path)
 
@@ -180,7 +239,7 @@ def test_mocks_prevent_real_file_writing(
         assert test_env_file.read_text() == original_content
 
         # Verify mocks were called instead
-        mock_file_operations.assert_called_once_with(Path(".env"), "a", encoding="utf-8")
+        mock_file_operations.assert_called_once_with(_FAKE_ENV_FD, "a", encoding="utf-8")
 
     finally:
         # Restore original working directory
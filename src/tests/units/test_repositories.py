@@ -8,9 +8,10 @@ from src.db.repositories import (
     BaseRepository,
     UserRepository,
     TokenRepository,
+    ReleaseRepository,
     FilterT,
 )
-from src.db.models import User, Token
+from src.db.models import User, Token, Release
 from src.exceptions import InstanceLookupError
 
 
@@ -239,6 +240,16 @@ class TestUserRepository:
             user_repo.all.assert_awaited_once_with(username="nonexistent")
             mock_logger.debug.assert_called_once()
 
+    @pytest.mark.parametrize("scalar_result", [True, False])
+    async def test_username_exists(self, user_repo: UserRepository, scalar_result: bool) -> None:
+        """Test username_exists returns result of EXISTS query."""
+        user_repo.session.scalar = AsyncMock(return_value=scalar_result)
+
+        result = await user_repo.username_exists("testuser")
+
+        assert result is scalar_result
+        user_repo.session.scalar.assert_awaited_once()
+
 
 class TestTokenRepository:
     """Tests for TokenRepository class."""
@@ -267,25 +278,31 @@ class TestTokenRepository:
         self, token_repo: TokenRepository, mock_token: MagicMock
     ) -> None:
         """Test get_by_token when token found."""
-        token_repo.all = AsyncMock(return_value=[mock_token])
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.first.return_value = mock_token
+        token_repo.session.execute = AsyncMock(return_value=mock_result)
 
         with patch("src.db.repositories.logger") as mock_logger:
             result = await token_repo.get_by_token("hashed_token_value")
 
             assert result == mock_token
-            token_repo.all.assert_awaited_once_with(token="hashed_token_value")
+            token_repo.session.execute.assert_awaited_once()
+            statement = token_repo.session.execute.await_args.args[0]
+            assert statement.compile().params == {"token_1": "hashed_token_value", "param_1": 1}
             mock_logger.debug.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_get_by_token_not_found(self, token_repo: TokenRepository) -> None:
         """Test get_by_token when token not found."""
-        token_repo.all = AsyncMock(return_value=[])
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.first.return_value = None
+        token_repo.session.execute = AsyncMock(return_value=mock_result)
 
         with patch("src.db.repositories.logger") as mock_logger:
             result = await token_repo.get_by_token("nonexistent")
 
             assert result is None
-            token_repo.all.assert_awaited_once_with(token="nonexistent")
+            token_repo.session.execute.assert_awaited_once()
             mock_logger.debug.assert_called_once()
 
     @pytest.mark.asyncio
@@ -293,7 +310,7 @@ class TestTokenRepository:
         """Test set_active with is_active=True."""
         token_ids = [1, 2, 3]
         mock_result = MagicMock()
-        mock_result.rowcount = 3
+        mock_result.scalars.return_value.all.return_value = [1, 2, 3]
         token_repo.session.execute = AsyncMock(return_value=mock_result)
         token_repo.session.flush = AsyncMock()
 
@@ -313,13 +330,14 @@ class TestTokenRepository:
         """Test set_active with is_active=False."""
         token_ids = [1, 2, 3]
         mock_result = MagicMock()
-        mock_result.rowcount = 2
+        mock_result.scalars.return_value.all.return_value = [1, 2]
         token_repo.session.execute = AsyncMock(return_value=mock_result)
         token_repo.session.flush = AsyncMock()
 
         with patch("src.db.repositories.logger") as mock_logger:
-            await token_repo.set_active(token_ids, False)
+            updated_ids = await token_repo.set_active(token_ids, False)
 
+            assert updated_ids == [1, 2]
             token_repo.session.execute.assert_awaited_once()
             token_repo.session.flush.assert_awaited_once()
 
@@ -333,7 +351,7 @@ class TestTokenRepository:
         """Test set_active with string IDs."""
         token_ids: list[int] = [1, 2, 3]
         mock_result = MagicMock()
-        mock_result.rowcount = 3
+        mock_result.scalars.return_value.all.return_value = [1, 2, 3]
         token_repo.session.execute = AsyncMock(return_value=mock_result)
         token_repo.session.flush = AsyncMock()
 
@@ -342,3 +360,72 @@ class TestTokenRepository:
 
             token_repo.session.execute.assert_awaited_once()
             token_repo.session.flush.assert_awaited_once()
+
+
+class TestReleaseRepository:
+    """Tests for ReleaseRepository class."""
+
+    @pytest.fixture
+    def release_repo(self) -> ReleaseRepository:
+        """Create ReleaseRepository instance for testing."""
+        return ReleaseRepository(session=AsyncMock(spec=AsyncSession))
+
+    async def test_set_active_returning(self, release_repo: ReleaseRepository) -> None:
+        """Test set_active_returning updates and returns releases in one statement."""
+        release = MagicMock(spec=Release)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [release]
+        release_repo.session.execute = AsyncMock(return_value=mock_result)
+
+        releases = await release_repo.set_active_returning([1], is_active=True)
+
+        assert releases == [release]
+        release_repo.session.execute.assert_awaited_once()
+        statement = release_repo.session.execute.await_args.args[0]
+        assert "UPDATE releases" in str(statement)
+        assert "RETURNING" in str(statement)
+
+    async def test_get_active_releases__single_query(self, release_repo: ReleaseRepository) -> None:
+        """Test get_active_releases takes total count from the page rows (window function)."""
+        releases = [MagicMock(spec=Release), MagicMock(spec=Release)]
+        mock_result = MagicMock()
+        mock_result.all.return_value = [MagicMock(total=5), MagicMock(total=5)]
+        for row, release in zip(mock_result.all.return_value, releases):
+            row.__getitem__.return_value = release
+
+        release_repo.session.execute = AsyncMock(return_value=mock_result)
+        release_repo.session.scalar = AsyncMock()
+
+        result = await release_repo.get_active_releases(offset=0, limit=2)
+
+        assert result == (releases, 5)
+        assert "count(*) OVER ()" in str(release_repo.session.execute.await_args.args[0])
+        release_repo.session.scalar.assert_not_awaited()
+
+    @pytest.mark.parametrize("offset, expected_total", ((0, 0), (10, 3)))
+    async def test_get_active_releases__empty_page(
+        self, release_repo: ReleaseRepository, offset: int, expected_total: int
+    ) -> None:
+        """Test get_active_releases counts total separately only for out-of-range pages."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        release_repo.session.execute = AsyncMock(return_value=mock_result)
+        release_repo.session.scalar = AsyncMock(return_value=3)
+
+        result = await release_repo.get_active_releases(offset=offset, limit=10)
+
+        assert result == ([], expected_total)
+        assert release_repo.session.scalar.await_count == (1 if offset else 0)
+
+    async def test_group_by_active(self, release_repo: ReleaseRepository) -> None:
+        """Test group_by_active counts both groups with a single-row query."""
+        mock_result = MagicMock()
+        mock_result.one.return_value = (3, 2)
+        release_repo.session.execute = AsyncMock(return_value=mock_result)
+
+        stat = await release_repo.group_by_active()
+
+        assert (stat.active, stat.inactive) == (3, 2)
+        statement = str(release_repo.session.execute.await_args.args[0])
+        assert "FILTER (WHERE" in statement
+        assert "GROUP BY" not in statement
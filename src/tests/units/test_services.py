@@ -316,6 +316,24 @@ class TestSASessionUOW:
         uow.mark_for_commit()
         assert uow.need_to_commit is True
 
+    async def test_read_only_mode(
+        self,
+        mock_db_session: MagicMock,
+        mock_db_session_factory: MagicMock,
+        mock_logger: MagicMock,
+    ) -> None:
+        async with SASessionUOW(read_only=True) as uow:
+            assert uow.session == mock_db_session
+
+        mock_db_session.begin.assert_not_awaited()
+        mock_db_session.flush.assert_not_awaited()
+        mock_db_session.commit.assert_not_awaited()
+        mock_db_session.close.assert_awaited_once()
+
+    def test_read_only_mode_with_external_session(self) -> None:
+        with pytest.raises(ValueError, match="standalone UOW only"):
+            SASessionUOW(session=AsyncMock(spec=AsyncSession), read_only=True)
+
 
 class TestSASessionUOWIntegration:
     """Integration tests for SASessionUOW."""
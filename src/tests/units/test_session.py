@@ -55,6 +55,10 @@ class TestAsyncDBConnectors:
 
                         # Verify engine creation
                         mock_create_engine.assert_called_once()
+                        engine_kwargs = mock_create_engine.call_args.kwargs
+                        assert engine_kwargs["pool_pre_ping"] == connectors.settings.pool_pre_ping
+                        assert engine_kwargs["pool_recycle"] == connectors.settings.pool_recycle
+                        assert engine_kwargs["pool_use_lifo"] == connectors.settings.pool_use_lifo
 
                         # Verify session factory creation
                         mock_session_maker.assert_called_once()
@@ -1,10 +1,13 @@
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
 
 import pytest
 from pydantic import SecretStr
+from sqlalchemy.engine import make_url
 
-from src.settings import AppSettings, get_app_settings
+from src.settings import AppSettings, get_app_settings, get_request_settings
+from src.settings.db import DBSettings
 from src.settings.log import LOG_LEVELS_PATTERN, LogSettings
 
 MINIMAL_ENV_VARS = {
@@ -37,6 +40,7 @@ class TestAppSettings:
         assert settings.flags.offline_mode is False
         assert settings.flags.api_docs_enabled is False
         assert settings.flags.api_cache_enabled is True
+        assert settings.flags.api_token_cache_enabled is True
 
     @pytest.mark.parametrize("log_level", LOG_LEVELS_PATTERN.split("|"))
     def test_valid_log_levels(self, log_level: str) -> None:
@@ -71,6 +75,21 @@ class TestAppSettings:
             for logger in ["src", "fastapi", "uvicorn.access", "uvicorn.error"]
         )
 
+    @patch.dict(os.environ, {"UI_TIMEZONE": "Europe/Moscow"})
+    def test_ui_timezone(self) -> None:
+        settings = AppSettings(app_secret_key=SecretStr("test-token"))
+        assert settings.ui_timezone == ZoneInfo("Europe/Moscow")
+        assert AppSettings(app_secret_key=SecretStr("test")).ui_timezone is settings.ui_timezone
+
+    @patch.dict(os.environ, {"UI_TIMEZONE": "Unknown/Zone"})
+    def test_ui_timezone__invalid(self) -> None:
+        assert AppSettings(app_secret_key=SecretStr("test-token")).ui_timezone is None
+
+    def test_log_config__cached(self) -> None:
+        log_settings = LogSettings(skip_static_access=True)
+        assert log_settings.dict_config is log_settings.dict_config
+        assert log_settings.dict_config_any is log_settings.dict_config_any
+
 
 class TestGetSettings:
     @patch.dict(
@@ -103,3 +122,18 @@ class TestGetSettings:
         settings1 = get_app_settings()
         settings2 = get_app_settings()
         assert settings1 is settings2  # Same object due to caching
+
+    async def test_get_request_settings(self, app_settings_test: AppSettings) -> None:
+        request = MagicMock(app=MagicMock(settings=app_settings_test))
+        assert await get_request_settings(request) is app_settings_test
+
+
+class TestDBSettings:
+
+    def test_dsn(self) -> None:
+        settings = DBSettings(user="user", password="pass", host="db", port=5433, name="agent")
+        assert settings.dsn == "postgresql+asyncpg://user:pass@db:5433/agent"
+
+    def test_dsn__password_encoded(self) -> None:
+        settings = DBSettings(password="p@ss:/w")
+        assert make_url(settings.dsn).password == "p@ss:/w"
@@ -1,4 +1,7 @@
-from src.utils import singleton
+import pytest
+from fastapi.responses import JSONResponse
+
+from src.utils import singleton, FastJSONResponse
 
 
 class TestSingleton:
@@ -67,3 +70,17 @@ class TestSingleton:
         # And states are not shared
         assert test1.value == "test"
         assert another1.value == 42
+
+
+class TestFastJSONResponse:
+
+    @pytest.mark.parametrize(
+        "content",
+        (
+            {"items": [{"id": 1, "version": "1.0.0", "notes": "Привет"}], "total": 1},
+            [1, 2.5, None, True],
+            "text",
+        ),
+    )
+    def test_same_body_as_json_response(self, content: object) -> None:
+        assert FastJSONResponse(content).body == JSONResponse(content).body
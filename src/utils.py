@@ -4,11 +4,16 @@ from typing import TypeVar, Callable, ParamSpec, Any, TYPE_CHECKING, Literal
 
 import markupsafe
 from fastapi import Request
+from fastapi.exception_handlers import http_exception_handler, request_validation_exception_handler
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
+from pydantic_core import to_json
 from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.constants import API_PATH_PREFIXES
 from src.models import ErrorResponse
 from src.settings import get_app_settings
 from src.exceptions import BaseApplicationError
@@ -16,7 +21,13 @@ from src.exceptions import BaseApplicationError
 if TYPE_CHECKING:
     from src.db.models import BaseModel
 
-__all__ = ("singleton", "universal_exception_handler")
+__all__ = (
+    "singleton",
+    "universal_exception_handler",
+    "api_exception_handler",
+    "ErrorHandlingMiddleware",
+    "FastJSONResponse",
+)
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 C = TypeVar("C")
@@ -40,6 +51,13 @@ def singleton(cls: type[C]) -> Callable[P, C]:
     return getinstance
 
 
+class FastJSONResponse(JSONResponse):
+    """JSON response which is rendered by pydantic-core's (Rust) serializer"""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
 async def universal_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Universal exception handler that handles all types of exceptions"""
 
@@ -85,6 +103,53 @@ async def universal_exception_handler(request: Request, exc: Exception) -> JSONR
     )
 
 
+async def api_exception_handler(request: Request, exc: Exception) -> Response:
+    """Unified JSON response for API routes, framework's default handling for the others"""
+    if request.url.path.startswith(API_PATH_PREFIXES):
+        return await universal_exception_handler(request, exc)
+
+    if isinstance(exc, HTTPException):
+        return await http_exception_handler(request, exc)
+
+    if isinstance(exc, RequestValidationError):
+        return await request_validation_exception_handler(request, exc)
+
+    raise exc
+
+
+class ErrorHandlingMiddleware:
+    """
+    Serves unexpected errors of API routes with the unified JSON response.
+    Unlike ServerErrorMiddleware's handler, the handled error is not re-raised (and not logged twice)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(API_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            if response_started:
+                # too late to send the error response
+                raise
+
+            response = await universal_exception_handler(Request(scope), exc)
+            await response(scope, receive, send)
+
+
 def utcnow(skip_tz: bool = True) -> datetime.datetime:
     """Just a simple wrapper for deprecated datetime.utcnow"""
     dt = datetime.datetime.now(datetime.UTC)